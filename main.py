@@ -84,7 +84,7 @@ class TrimixScreenManager(ScreenManager):
     
     def transition_to(self, screen_name: str):
         """Navigate to screen while tracking history"""
-        if hasattr(self, 'current') and self.current:
+        if self.current:
             self.previous_screen = self.current
         
         self.current = screen_name
@@ -113,6 +113,9 @@ class TrimixApp(App):
         screen_manager = TrimixScreenManager(transition=FadeTransition())
         screen_manager.current = 'home'
         
+        # The Kivy loop is about to run, so let bursts of writes reach listeners once per frame
+        db_manager.coalesce_changes = True
+        
         # Schedule initialization tasks
         self._schedule_initialization_tasks()
         
@@ -14,14 +14,6 @@ class DisplaySettingsScreen(Screen):
     brightness = NumericProperty(50)  # Default brightness percentage
     sleep_timeout = NumericProperty(5)  # Default sleep timeout in minutes
     
-    def __init__(self, **kwargs):
-        """
-        Initializes the DisplaySettingsScreen and binds to external database setting changes to keep the UI in sync.
-        """
-        super().__init__(**kwargs)
-        # Bind to database changes
-        settings_manager.bind(settings=self.on_settings_changed)
-    
     def navigate_back(self):
         """
         Switches the current screen to the main settings screen.
@@ -42,6 +34,9 @@ class DisplaySettingsScreen(Screen):
         
         Also attempts to read the current system brightness and sleep timeout values for verification and synchronization.
         """
+        # Keep the UI in sync with external changes while the screen is shown
+        settings_manager.bind(settings=self.on_settings_changed)
+        
         # Load settings from the database first
         self.brightness = settings_manager.get('display.brightness', 50)
         self.sleep_timeout = settings_manager.get('display.sleep_timeout', 5)
@@ -49,6 +44,10 @@ class DisplaySettingsScreen(Screen):
         # Also try to read current system state for verification
         self.load_current_brightness()
         self.load_current_sleep_timeout()
+    
+    def on_leave(self):
+        """Stop listening for settings changes while the screen is hidden"""
+        settings_manager.unbind(settings=self.on_settings_changed)
         
     def load_current_brightness(self):
         """Load the current screen brightness from the system"""
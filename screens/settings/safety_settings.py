@@ -14,11 +14,6 @@ class SafetySettingsScreen(Screen):
     low_o2_threshold = NumericProperty(19.0)
     high_he_threshold = NumericProperty(50.0)
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Bind to settings changes
-        settings_manager.bind(settings=self.on_settings_changed)
-    
     def navigate_back(self):
         """Navigate back to settings screen"""
         self.manager.current = 'settings'
@@ -31,7 +26,12 @@ class SafetySettingsScreen(Screen):
         """
         Loads and applies the latest safety settings when the screen becomes active.
         """
+        settings_manager.bind(settings=self.on_settings_changed)
         self.load_settings_from_manager()
+    
+    def on_leave(self):
+        """Stop listening for settings changes while the screen is hidden"""
+        settings_manager.unbind(settings=self.on_settings_changed)
         
     def load_settings_from_manager(self):
         """
@@ -212,11 +212,13 @@ class SafetySettingsScreen(Screen):
         # Reset to default values
         defaults = settings_manager.default_settings['safety']
         
-        settings_manager.set('safety.max_o2_percentage', defaults['max_o2_percentage'])
-        settings_manager.set('safety.max_he_percentage', defaults['max_he_percentage'])
-        settings_manager.set('safety.warning_thresholds_high_o2', defaults['warning_thresholds']['high_o2'])
-        settings_manager.set('safety.warning_thresholds_low_o2', defaults['warning_thresholds']['low_o2'])
-        settings_manager.set('safety.warning_thresholds_high_he', defaults['warning_thresholds']['high_he'])
+        settings_manager.set_many({
+            'safety.max_o2_percentage': defaults['max_o2_percentage'],
+            'safety.max_he_percentage': defaults['max_he_percentage'],
+            'safety.warning_thresholds_high_o2': defaults['warning_thresholds']['high_o2'],
+            'safety.warning_thresholds_low_o2': defaults['warning_thresholds']['low_o2'],
+            'safety.warning_thresholds_high_he': defaults['warning_thresholds']['high_he'],
+        })
         
         # Reload to update UI
         self.load_settings_from_manager()
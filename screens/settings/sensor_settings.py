@@ -16,11 +16,6 @@ class SensorSettingsScreen(Screen):
     he_calibration_offset = NumericProperty(0.0)
     auto_calibrate = BooleanProperty(True)
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Bind to settings changes
-        settings_manager.bind(settings=self.on_settings_changed)
-    
     def navigate_back(self):
         """Navigate back to settings screen"""
         self.manager.current = 'settings'
@@ -31,7 +26,12 @@ class SensorSettingsScreen(Screen):
         
     def on_enter(self):
         """Called when entering the screen"""
+        settings_manager.bind(settings=self.on_settings_changed)
         self.load_settings_from_manager()
+    
+    def on_leave(self):
+        """Stop listening for settings changes while the screen is hidden"""
+        settings_manager.unbind(settings=self.on_settings_changed)
         
     def load_settings_from_manager(self):
         """Load current sensor settings from the settings manager"""
@@ -96,12 +96,13 @@ class SensorSettingsScreen(Screen):
         he_date_str = settings_manager.get('sensors.he_calibration_date')
         
         status_lines = []
+        now = datetime.now()
         
         # O2 status
         if o2_date_str:
             try:
                 o2_date = datetime.fromisoformat(o2_date_str)
-                days_ago = (datetime.now() - o2_date).days
+                days_ago = (now - o2_date).days
                 status_lines.append(f"O2: {days_ago} days ago")
             except ValueError:
                 status_lines.append("O2: Invalid date")
@@ -112,7 +113,7 @@ class SensorSettingsScreen(Screen):
         if he_date_str:
             try:
                 he_date = datetime.fromisoformat(he_date_str)
-                days_ago = (datetime.now() - he_date).days
+                days_ago = (now - he_date).days
                 status_lines.append(f"He: {days_ago} days ago")
             except ValueError:
                 status_lines.append("He: Invalid date")
@@ -251,11 +252,13 @@ class SensorSettingsScreen(Screen):
         # Reset to default values from settings manager
         defaults = settings_manager.default_settings['sensors']
         
-        settings_manager.set('sensors.calibration_interval_days', defaults['calibration_interval_days'])
-        settings_manager.set('sensors.auto_calibration_reminder', defaults['auto_calibration_reminder'])
-        settings_manager.set('sensors.o2_calibration_offset', defaults['o2_calibration_offset'])
-        settings_manager.set('sensors.he_calibration_offset', defaults['he_calibration_offset'])
-        settings_manager.set('sensors.auto_calibrate', defaults['auto_calibrate'])
+        settings_manager.set_many({
+            'sensors.calibration_interval_days': defaults['calibration_interval_days'],
+            'sensors.auto_calibration_reminder': defaults['auto_calibration_reminder'],
+            'sensors.o2_calibration_offset': defaults['o2_calibration_offset'],
+            'sensors.he_calibration_offset': defaults['he_calibration_offset'],
+            'sensors.auto_calibrate': defaults['auto_calibrate'],
+        })
         
         # Reload from settings manager to update UI
         self.load_settings_from_manager()
@@ -45,8 +45,6 @@ class WiFiSettingsScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.scanning = False
-        # Bind to settings changes
-        settings_manager.bind(settings=self.on_settings_changed)
     
     def navigate_back(self):
         """Navigate back to settings screen"""
@@ -63,8 +61,13 @@ class WiFiSettingsScreen(Screen):
         """
         Triggers a scan for available WiFi networks and checks the current connection status when the screen is entered.
         """
+        settings_manager.bind(settings=self.on_settings_changed)
         self.scan_networks()
         self.check_connection_status()
+    
+    def on_leave(self):
+        """Stop listening for settings changes while the screen is hidden"""
+        settings_manager.unbind(settings=self.on_settings_changed)
         
     def scan_networks(self):
         """Scan for available WiFi networks"""
@@ -13,6 +13,24 @@ from datetime import datetime, timedelta
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Importing utils.database_manager opens the global db_manager at ~/.trimix_data.db, so point
+# HOME at a scratch directory before any test module is collected; tests never touch the user's database
+_TEST_HOME = tempfile.mkdtemp(prefix='trimix_test_home_')
+os.environ['HOME'] = _TEST_HOME
+
+
+class _KivyAppSpec:
+    """Attributes of kivy.app.App that the mock_kivy_app fixture exposes."""
+    
+    def build(self):
+        pass
+    
+    def on_start(self):
+        pass
+    
+    def stop(self):
+        pass
+
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
@@ -34,39 +52,58 @@ def setup_test_environment():
     # Cleanup
     if os.path.exists(test_db_path):
         os.remove(test_db_path)
+    shutil.rmtree(_TEST_HOME, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_sensors(setup_test_environment):
+    """
+    Resolves the sensor singleton once per session, after the mock-sensor environment is in place, so no test pays for first-call setup.
+    """
+    from utils.sensor_interface import get_sensors
+    
+    get_sensors()
+
+
+@pytest.fixture(autouse=True)
+def _reset_sensor_history():
+    """
+    Clears the recorded sensor history after every test so readings recorded by one test never leak into another.
+    """
+    from utils.sensor_interface import _history
+    
+    yield
+    
+    for history in _history.values():
+        history.clear()
 
 
 @pytest.fixture
-def temp_database():
+def temp_database(tmp_path_factory):
     """
-    Creates and yields the filename of a temporary database file for testing, ensuring the file is deleted after the test completes.
+    Yields the filename of a database file in a fresh pytest-managed temporary directory.
+    
+    pytest removes the directory as part of its own temporary directory rotation, so no manual cleanup is needed.
     
     Yields:
         str: The path to the temporary database file.
     """
-    temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
-    temp_db.close()
-    
-    yield temp_db.name
-    
-    # Cleanup
-    if os.path.exists(temp_db.name):
-        os.remove(temp_db.name)
+    yield str(tmp_path_factory.mktemp("db") / "test.db")
 
 
 @pytest.fixture
-def mock_database_manager(temp_database):
+def mock_database_manager():
     """
-    Yield a DatabaseManager instance using a temporary database, with event dispatching patched for testing.
+    Yield a DatabaseManager instance backed by an in-memory SQLite database, with event dispatching patched for testing.
     
     Yields:
-        DatabaseManager: An instance connected to a temporary database, with its event dispatch method mocked to prevent Kivy-related errors during tests.
+        DatabaseManager: An instance connected to a fresh in-memory database, with its event dispatch method mocked to prevent Kivy-related errors during tests.
     """
     from utils.database_manager import DatabaseManager
     from unittest.mock import patch
     
-    # Create a fresh database manager with temp db
-    db = DatabaseManager(temp_database)
+    # A fresh in-memory database per test avoids disk I/O while keeping tests isolated
+    db = DatabaseManager(':memory:')
     
     # Mock the event dispatching to avoid Kivy event errors in tests
     with patch.object(db, 'dispatch'):
@@ -76,6 +113,21 @@ def mock_database_manager(temp_database):
     db.close()
 
 
+@pytest.fixture
+def settings():
+    """
+    Return a fresh SimpleSettings instance for each test.
+    
+    SimpleSettings keeps its bound callbacks and deferred-notification state per instance, so sharing one would leak that state between tests. It looks up db_manager on every call, so tests that patch `utils.simple_settings.db_manager` (e.g. with mock_database_manager) get an isolated database.
+    
+    Returns:
+        SimpleSettings: The settings instance for this test.
+    """
+    from utils.simple_settings import SimpleSettings
+    
+    return SimpleSettings()
+
+
 @pytest.fixture
 def sample_sensor_data():
     """
@@ -126,11 +178,13 @@ def mock_kivy_app():
     """
     Provides a MagicMock instance in place of the Kivy App class for UI testing.
     
+    The mock is specced to the App methods tests use, so MagicMock only builds child mocks for those attributes.
+    
     Yields:
         MagicMock: A mock Kivy App instance for use in tests.
     """
     with patch('kivy.app.App') as mock_app:
-        mock_instance = MagicMock()
+        mock_instance = MagicMock(spec=_KivyAppSpec)
         mock_app.return_value = mock_instance
         yield mock_instance
 
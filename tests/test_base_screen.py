@@ -0,0 +1,27 @@
+"""
+Tests for the BaseScreen helpers shared by all screens.
+"""
+
+import pytest
+from types import SimpleNamespace
+
+
+class TestValidateNumericInput:
+    """Test BaseScreen.validate_numeric_input."""
+
+    @pytest.mark.unit
+    def test_range_messages_follow_bound_types(self):
+        """
+        Verify that int and float bounds with equal values each get messages formatted with their own type, whichever is validated first.
+        
+        Both fields take floats, so only the types of the bounds tell the cached messages apart.
+        """
+        from utils.base_screen import BaseScreen
+        
+        errors = []
+        screen = SimpleNamespace(show_error=lambda title, message: errors.append(message))
+        
+        assert BaseScreen.validate_numeric_input(screen, '-1', 0, 100, input_type=float) is None
+        assert BaseScreen.validate_numeric_input(screen, '-1', 0.0, 100.0, input_type=float) is None
+        
+        assert errors == ["Value must be at least 0", "Value must be at least 0.0"]
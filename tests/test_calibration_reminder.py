@@ -490,3 +490,66 @@ class TestCalibrationReminder:
             
             status = calibration_reminder.check_calibration_due()
             assert status['interval_days'] == 30  # Default interval
+
+    @pytest.mark.unit
+    def test_periodic_check_caches_inputs_until_change(self, calibration_reminder):
+        """
+        Verify that repeated periodic checks read the calibration inputs once, and read them again after a calibration is recorded.
+        """
+        with patch('utils.calibration_reminder.db_manager') as mock_db:
+            mock_db.get_last_calibration.return_value = datetime.now() - timedelta(days=1)
+            mock_db.get_setting.return_value = 30
+            
+            calibration_reminder._periodic_check(0)
+            calibration_reminder._periodic_check(0)
+            assert mock_db.get_last_calibration.call_count == 2  # o2 and he, once
+            
+            calibration_reminder._on_data_changed(mock_db, 'calibration', 'o2', datetime.now())
+            calibration_reminder._periodic_check(0)
+            assert mock_db.get_last_calibration.call_count == 4
+
+    @pytest.mark.unit
+    def test_periodic_check_stops_when_reminders_disabled(self, calibration_reminder):
+        """
+        Verify that the periodic check unschedules itself when reminders are disabled and is scheduled again once they are re-enabled.
+        """
+        with patch('utils.calibration_reminder.db_manager') as mock_db, \
+                patch('utils.calibration_reminder.Clock') as mock_clock:
+            calibration_reminder.schedule_periodic_check()
+            assert mock_clock.schedule_interval.call_count == 1
+            
+            mock_db.get_setting.return_value = False
+            assert calibration_reminder._periodic_check(0) == False
+            mock_db.get_last_calibration.assert_not_called()
+            
+            calibration_reminder._on_data_changed(mock_db, 'setting', 'sensors.auto_calibration_reminder', True)
+            assert mock_clock.schedule_interval.call_count == 2
+
+    @pytest.mark.unit
+    def test_reminder_popup_is_built_once(self, calibration_reminder):
+        """
+        Verify that the reminder popup widgets are built on the first reminder and reused, with updated text, for the next one.
+        """
+        status = {
+            'o2_due': True,
+            'he_due': False,
+            'o2_days_overdue': 5,
+            'he_days_overdue': 0,
+            'o2_last_calibration': datetime.now() - timedelta(days=35),
+            'he_last_calibration': None,
+            'interval_days': 30
+        }
+        
+        with patch('utils.calibration_reminder.Popup') as mock_popup, \
+                patch('utils.calibration_reminder.BoxLayout'), \
+                patch('utils.calibration_reminder.Label'), \
+                patch('utils.calibration_reminder.Button'):
+            calibration_reminder._create_reminder_popup(status)
+            calibration_reminder._remind_later(None)
+            assert calibration_reminder.popup is None
+            
+            calibration_reminder._create_reminder_popup(dict(status, o2_days_overdue=6))
+        
+        mock_popup.assert_called_once()
+        assert mock_popup.return_value.open.call_count == 2
+        assert '6 days overdue' in calibration_reminder._message_label.text
@@ -7,7 +7,7 @@ import os
 import tempfile
 import json
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, call
 
 from utils.database_manager import DatabaseManager
 
@@ -37,6 +37,19 @@ class TestDatabaseManager:
         
         db.close()
 
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_database_uses_wal_journal(self, temp_database):
+        """
+        Verify that a file-backed database is opened in WAL mode with relaxed synchronous writes.
+        """
+        db = DatabaseManager(temp_database)
+        
+        assert db.connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert db.connection.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+        
+        db.close()
+
     @pytest.mark.unit
     @pytest.mark.database
     def test_set_and_get_setting_string(self, mock_database_manager):
@@ -135,6 +148,83 @@ class TestDatabaseManager:
         value = db.get_setting('test', 'list_key')
         assert value == test_list
 
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_setting_cache_matches_stored_values(self, mock_database_manager):
+        """
+        Verify that cached setting reads return what the database stores, and that mutating a returned JSON value does not leak into later reads.
+        """
+        db = mock_database_manager
+        
+        db.set_setting('test', 'none_key', None)
+        assert db.get_setting('test', 'none_key') == 'None'
+        
+        db.set_setting('test', 'list_key', [1, 2])
+        db.get_setting('test', 'list_key').append(3)
+        assert db.get_setting('test', 'list_key') == [1, 2]
+        
+        db.set_setting('test', 'int_key', 7)
+        assert db._settings_cache[('test', 'int_key')] == 7
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_set_setting_skips_unchanged_value(self, mock_database_manager):
+        """
+        Verify that writing a setting's current value neither dispatches a change event nor masks a change of type.
+        """
+        db = mock_database_manager
+        
+        db.set_setting('test', 'flag', 1)
+        db.dispatch.reset_mock()
+        
+        assert db.set_setting('test', 'flag', 1) == True
+        db.dispatch.assert_not_called()
+        
+        assert db.set_setting('test', 'flag', True) == True
+        db.dispatch.assert_called_once()
+        assert db.get_setting('test', 'flag') is True
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_json_encoding_matches_fallback(self, mock_database_manager):
+        """
+        Verify that JSON settings are stored exactly as the json.dumps fallback would store them, non-finite floats included.
+        """
+        import math
+        from utils.database_manager import _dumps, _json_dumps
+        
+        value = {'limits': [1, 2.5, None], 'name': 'Tx 21/35', 'nan': float('nan'), 'inf': float('inf')}
+        assert _dumps(value) == _json_dumps(value)
+        assert _dumps({'name': 'Tx 21/35'}) == _json_dumps({'name': 'Tx 21/35'})
+        
+        db = mock_database_manager
+        db.set_setting('test', 'json_key', value)
+        stored = db.get_setting('test', 'json_key')
+        assert math.isnan(stored['nan'])
+        assert stored['inf'] == float('inf')
+        assert stored['limits'] == [1, 2.5, None]
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_set_setting_writes_after_external_change(self, temp_database):
+        """
+        Verify that a value changed through another connection is written again even though this manager's cache still holds it.
+        """
+        from utils.database_manager import DatabaseManager
+        db = DatabaseManager(temp_database)
+        other = DatabaseManager(temp_database)
+        try:
+            db.set_setting('test', 'shared', 1)
+            other.set_setting('test', 'shared', 2)
+            
+            assert db.set_setting('test', 'shared', 1) == True
+            assert other.connection.execute(
+                "SELECT value FROM settings WHERE category = 'test' AND key = 'shared'"
+            ).fetchone()[0] == '1'
+        finally:
+            other.close()
+            db.close()
+
     @pytest.mark.unit
     @pytest.mark.database
     def test_get_setting_default_value(self, mock_database_manager):
@@ -168,6 +258,24 @@ class TestDatabaseManager:
         assert category_settings['key2'] == 42
         assert category_settings['key3'] == True
 
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_set_settings_bulk(self, mock_database_manager):
+        """
+        Test that settings from several categories are stored in one bulk call with their types preserved.
+        """
+        db = mock_database_manager
+        
+        success = db.set_settings_bulk({
+            'bulk_a': {'name': 'value', 'count': 3},
+            'bulk_b': {'enabled': True, 'limits': [1, 2]}
+        })
+        assert success == True
+        
+        assert db.get_settings_category('bulk_a') == {'count': 3, 'name': 'value'}
+        assert db.get_setting('bulk_b', 'enabled') == True
+        assert db.get_setting('bulk_b', 'limits') == [1, 2]
+
     @pytest.mark.unit
     @pytest.mark.database
     def test_record_calibration(self, mock_database_manager):
@@ -191,6 +299,25 @@ class TestDatabaseManager:
         assert last_cal is not None
         assert isinstance(last_cal, datetime)
 
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_malformed_calibration_date(self, mock_database_manager):
+        """
+        Verify that one malformed calibration date neither hides the rest of the calibration history nor the last valid calibration.
+        """
+        db = mock_database_manager
+        
+        with db.connection as conn:
+            conn.execute(
+                "INSERT INTO calibration_history (sensor_type, calibration_date) VALUES ('o2', 'garbage')"
+            )
+        db.record_calibration('o2', voltage_reading=1.5)
+        
+        history = db.get_calibration_history('o2')
+        assert len(history) == 2
+        assert 'garbage' in [entry['calibration_date'] for entry in history]
+        assert isinstance(db.get_last_calibration('o2'), datetime)
+
     @pytest.mark.unit
     @pytest.mark.database
     def test_get_calibration_history(self, mock_database_manager):
@@ -222,7 +349,7 @@ class TestDatabaseManager:
     @pytest.mark.database
     def test_log_system_event(self, mock_database_manager):
         """
-        Tests that a system event can be logged with associated data and that the operation completes successfully.
+        Tests that a system event can be logged with associated data and is written to the system_events table once flushed.
         """
         db = mock_database_manager
         
@@ -230,8 +357,48 @@ class TestDatabaseManager:
         success = db.log_system_event('test_event', event_data)
         assert success == True
         
-        # Verify event was logged (we'd need to add a method to retrieve events)
-        # For now, just check the function completed successfully
+        # Events are written in the background; flushing makes this one visible
+        db.flush_events()
+        row = db.connection.execute(
+            "SELECT event_data FROM system_events WHERE event_type = 'test_event'"
+        ).fetchone()
+        assert json.loads(row[0]) == event_data
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_log_system_event_after_close(self):
+        """
+        Verify that logging an event on a closed database fails without starting a writer thread.
+        """
+        from utils.database_manager import DatabaseManager
+        db = DatabaseManager(':memory:')
+        db.log_system_event('before_close', {})
+        db.close()
+        
+        assert db.log_system_event('after_close', {'key': 'value'}) == False
+        assert db._event_thread is None
+        db.flush_events()
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_unclosed_database_is_collected(self):
+        """
+        Verify that a database with a running event thread is still garbage collected when nobody closes it, and that its thread stops.
+        """
+        import gc
+        import weakref
+        from utils.database_manager import DatabaseManager
+        db = DatabaseManager(':memory:')
+        db.log_system_event('test_event', {'key': 'value'})
+        thread = db._event_thread
+        ref = weakref.ref(db)
+        
+        del db
+        gc.collect()
+        
+        assert ref() is None
+        thread.join(5)
+        assert not thread.is_alive()
 
     @pytest.mark.unit
     @pytest.mark.database
@@ -325,6 +492,41 @@ class TestDatabaseManager:
         finally:
             db.close()
 
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_factory_reset_dispatches_once(self, mock_database_manager):
+        """
+        Verify that a factory reset reseeds the defaults without per-setting events and dispatches a single factory_reset event.
+        """
+        db = mock_database_manager
+        db.dispatch.reset_mock()
+        
+        assert db.factory_reset() == True
+        
+        db.dispatch.assert_called_once_with('on_data_changed', 'factory_reset', None, None)
+
+    @pytest.mark.unit
+    @pytest.mark.database
+    def test_change_events_coalesced(self, mock_database_manager):
+        """
+        Verify that with coalescing enabled, repeated writes to a setting before the next frame dispatch one change event carrying the last value.
+        """
+        db = mock_database_manager
+        db.coalesce_changes = True
+        db.dispatch.reset_mock()
+        
+        db.set_setting('display', 'brightness', 10)
+        db.set_setting('display', 'brightness', 20)
+        db.set_setting('display', 'sleep_timeout', 12)
+        db.set_setting('display', 'brightness', 30)
+        db.dispatch.assert_not_called()
+        
+        db.flush_changes()
+        assert db.dispatch.call_args_list == [
+            call('on_data_changed', 'setting', 'display.sleep_timeout', 12),
+            call('on_data_changed', 'setting', 'display.brightness', 30),
+        ]
+
     @pytest.mark.unit
     @pytest.mark.database
     def test_default_settings_initialization(self, temp_database):
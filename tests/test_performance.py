@@ -14,28 +14,22 @@ class TestPerformance:
 
     @pytest.mark.slow
     @pytest.mark.performance
-    def test_sensor_reading_performance(self, benchmark):
+    @pytest.mark.benchmark(group='sensors')
+    def test_sensor_reading_performance(self, benchmark, record_property):
         """
-        Benchmarks the performance of the sensor reading operation using `get_readings()`.
+        Benchmarks `get_readings()` with warm-up rounds separated from the measured rounds, so first-call setup does not skew the timing.
         
-        Asserts that the result is a non-empty dictionary to verify correct sensor data retrieval.
+        The mean time per reading is reported as a test property (visible in JUnit XML) rather than printed.
         """
+        benchmark.extra_info['budget_ns'] = 10_000
         
-        def read_sensors():
-            """
-            Retrieve the latest sensor readings as a dictionary.
-            
-            Returns:
-                dict: A dictionary containing the most recent sensor readings.
-            """
-            return get_readings()
-        
-        # Benchmark the sensor reading function
-        result = benchmark(read_sensors)
+        result = benchmark.pedantic(get_readings, rounds=50, iterations=100, warmup_rounds=5)
         
         # Verify result is valid
         assert isinstance(result, dict)
         assert len(result) > 0
+        if benchmark.stats is not None:
+            record_property('mean_ns', int(benchmark.stats.stats.mean * 1e9))
 
     @pytest.mark.slow
     @pytest.mark.performance
@@ -3,8 +3,35 @@ Comprehensive unit tests for sensor interface functionality.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-from utils.sensor_interface import get_sensors, get_readings, record_readings, get_history
+from utils.sensor_interface import get_sensors, get_readings, record_readings, get_history, _history
+
+
+# Realistic (low, high) bounds for each mock sensor reading
+_EXPECTED_RANGES = {
+    'read_oxygen_voltage': (0, 5.0),
+    'read_oxygen_percent': (0, 100),
+    'read_co2_voltage': (0, 5.0),
+    'read_co2_ppm': (0, 10000),
+    'read_temperature_c': (-50, 100),
+    'read_pressure_hpa': (0.8, 1.2),  # Pressure in BAR
+    'read_humidity_pct': (0, 100),
+}
+
+
+class BrokenSensors:
+    """Sensor stub whose O2 reading fails, for error-injection tests."""
+    
+    def read_oxygen_percent(self):
+        raise RuntimeError("Sensor failure")
+    
+    def read_temperature_c(self):
+        return 22.0
+    
+    def read_pressure_hpa(self):
+        return 1.0
+    
+    def read_humidity_pct(self):
+        return 50.0
 
 
 class TestSensorInterface:
@@ -27,34 +54,23 @@ class TestSensorInterface:
 
     @pytest.mark.unit
     @pytest.mark.sensor
-    def test_mock_sensor_readings_within_expected_ranges(self, mock_sensor_interface):
+    @pytest.mark.parametrize("method,low,high", [
+        (method, low, high) for method, (low, high) in _EXPECTED_RANGES.items()
+    ], ids=list(_EXPECTED_RANGES))
+    def test_mock_sensor_readings_within_expected_ranges(self, mock_sensor_interface, method, low, high):
         """
-        Verify that mock sensor interface readings for oxygen, CO2, temperature, pressure, humidity, and button state fall within realistic and expected value ranges.
+        Verify that each mock sensor interface reading falls within its realistic and expected value range.
         """
-        sensors = mock_sensor_interface
-        
-        # Test O2 readings
-        o2_voltage = sensors.read_oxygen_voltage()
-        o2_percent = sensors.read_oxygen_percent()
-        assert 0 <= o2_voltage <= 5.0
-        assert 0 <= o2_percent <= 100
-        
-        # Test CO2 readings
-        co2_voltage = sensors.read_co2_voltage()
-        co2_ppm = sensors.read_co2_ppm()
-        assert 0 <= co2_voltage <= 5.0
-        assert 0 <= co2_ppm <= 10000
-        
-        # Test environmental readings
-        temperature = sensors.read_temperature_c()
-        pressure = sensors.read_pressure_hpa()
-        humidity = sensors.read_humidity_pct()
-        assert -50 <= temperature <= 100
-        assert 0.8 <= pressure <= 1.2  # Pressure in BAR
-        assert 0 <= humidity <= 100
-        
-        # Test button state
-        button = sensors.is_power_button_pressed()
+        value = getattr(mock_sensor_interface, method)()
+        assert low <= value <= high, f"{method}() returned {value}, expected {low}..{high}"
+
+    @pytest.mark.unit
+    @pytest.mark.sensor
+    def test_mock_sensor_button_state(self, mock_sensor_interface):
+        """
+        Verify that the mock sensor interface reports the power button state as a boolean.
+        """
+        button = mock_sensor_interface.is_power_button_pressed()
         assert isinstance(button, bool)
 
     @pytest.mark.unit
@@ -101,14 +117,6 @@ class TestSensorInterface:
         """
         Verify that calling record_readings() appends new sensor data to the internal history for each sensor type.
         """
-        from utils.sensor_interface import get_history, _history
-        
-        # Clear history before test
-        _history['o2'].clear()
-        _history['temp'].clear()
-        _history['press'].clear()
-        _history['hum'].clear()
-        
         # Record some readings
         record_readings()
         
@@ -171,15 +179,11 @@ class TestSensorInterface:
 
     @pytest.mark.unit
     @pytest.mark.sensor
-    @patch('utils.sensor_interface.get_sensors')
-    def test_sensor_interface_error_handling(self, mock_get_sensors):
+    def test_sensor_interface_error_handling(self, mocker):
         """
         Tests that the sensor interface handles exceptions raised during sensor reading, either by returning a dictionary or by propagating the exception.
         """
-        # Mock sensor interface that raises an exception
-        mock_sensors = MagicMock()
-        mock_sensors.read_oxygen_percent.side_effect = Exception("Sensor failure")
-        mock_get_sensors.return_value = mock_sensors
+        mocker.patch('utils.sensor_interface.get_sensors', return_value=BrokenSensors())
         
         # get_readings should handle the exception gracefully
         try:
@@ -248,40 +252,26 @@ class TestSensorInterface:
         humidity_reading = sensors.read_humidity_pct()
         assert abs(humidity_reading - 50.0) < 5.0  # Allow 5% tolerance
 
-    @pytest.mark.integration
-    @pytest.mark.sensor
-    def test_sensor_data_persistence(self):
+    @pytest.fixture(scope='class')
+    def recorded_n_readings(self):
         """
-        Verify that sensor data history retains multiple recorded readings for each sensor type.
+        Record three sensor readings once for the whole class and snapshot the resulting history for every sensor type.
         
-        Records sensor readings three times and asserts that the history for each sensor type contains at least three entries, confirming data persistence.
-        """
-        # Record multiple readings
-        for _ in range(3):
-            record_readings()
+        The snapshot is taken immediately, because the per-test history reset clears the live history after each test.
         
-        # Get history for each sensor type
-        for sensor_type in ['o2', 'temp', 'press', 'hum']:
-            history = get_history(sensor_type)
-            assert len(history) >= 3  # Should have at least 3 readings
+        Returns:
+            dict: Mapping of sensor type to its history list.
+        """
+        record_readings(n=3)
+        return {sensor_type: get_history(sensor_type) for sensor_type in _history}
 
-    @pytest.mark.slow
+    @pytest.mark.integration
     @pytest.mark.sensor
-    def test_sensor_reading_performance(self):
+    @pytest.mark.parametrize("sensor_type", ['o2', 'temp', 'press', 'hum'])
+    def test_sensor_data_persistence(self, sensor_type, recorded_n_readings):
         """
-        Measures the time required to perform 100 consecutive sensor readings and asserts that the total duration is under 1 second.
-        """
-        import time
-        
-        start_time = time.time()
-        
-        # Read sensors multiple times
-        for _ in range(100):
-            readings = get_readings()
-        
-        end_time = time.time()
-        total_time = end_time - start_time
+        Verify that sensor data history retains multiple recorded readings for each sensor type.
         
-        # Should be able to read sensors 100 times in less than 1 second
-        assert total_time < 1.0
-        print(f"100 sensor readings took {total_time:.3f} seconds")
+        Asserts that the history recorded by the shared fixture contains at least three entries for the given sensor type, confirming data persistence.
+        """
+        assert len(recorded_n_readings[sensor_type]) >= 3  # Should have at least 3 readings
@@ -3,251 +3,336 @@ Tests for SimpleSettings management system.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import threading
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Expected message when a settings key lacks a category
+_INVALID_KEY_RE = re.compile(r"must include category")
+
+# One (key, value) pair per data type SimpleSettings must round-trip
+_TYPE_CASES = (
+    ('bool_value', True),
+    ('int_value', 42),
+    ('float_value', 3.14),
+    ('str_value', 'hello'),
+    ('dict_value', {'key': 'value'}),
+    ('list_value', [1, 2, 3]),
+)
+
+
+@pytest.fixture(scope='module')
+def thread_pool():
+    """
+    Provide a thread pool shared by the thread-safety tests in this module.
+    
+    It has more workers than most CPUs have cores, so workers genuinely contend for the database.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield executor
 
 
 class TestSettingsManagement:
     """Test SimpleSettings functionality."""
 
+    @pytest.fixture(autouse=True)
+    def _patch_db(self, mock_database_manager, monkeypatch):
+        """
+        Point the global db_manager used by SimpleSettings at the test database for every test.
+        """
+        monkeypatch.setattr('utils.simple_settings.db_manager', mock_database_manager)
+
     @pytest.mark.unit
-    def test_simple_settings_get_with_dot_notation(self, mock_database_manager):
+    def test_simple_settings_get_with_dot_notation(self, settings, mock_database_manager):
         """
         Verify that SimpleSettings.get() retrieves a setting value using dot notation (category.key) from the database.
         """
-        from utils.simple_settings import SimpleSettings
+        # Set a test value in database
+        mock_database_manager.set_setting('display', 'brightness', 75)
         
-        # Patch the global db_manager used by SimpleSettings
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            db = mock_database_manager
-            settings = SimpleSettings()
-            
-            # Set a test value in database
-            db.set_setting('display', 'brightness', 75)
-            
-            # Get value using dot notation
-            value = settings.get('display.brightness')
-            assert value == 75
+        # Get value using dot notation
+        value = settings.get('display.brightness')
+        assert value == 75
 
     @pytest.mark.unit
-    def test_simple_settings_get_default_value(self, mock_database_manager):
+    def test_simple_settings_get_default_value(self, settings):
         """
         Test that SimpleSettings.get() returns the provided default value when a setting does not exist.
         """
-        from utils.simple_settings import SimpleSettings
-        
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            settings = SimpleSettings()
-            
-            # Get non-existent setting with default
-            value = settings.get('nonexistent.setting', 'default_value')
-            assert value == 'default_value'
+        # Get non-existent setting with default
+        value = settings.get('nonexistent.setting', 'default_value')
+        assert value == 'default_value'
 
     @pytest.mark.unit
-    def test_simple_settings_set_with_dot_notation(self, mock_database_manager):
+    def test_simple_settings_set_with_dot_notation(self, settings, mock_database_manager):
         """
         Test that the SimpleSettings.set() method correctly stores a value using dot notation and updates the underlying database.
         """
-        from utils.simple_settings import SimpleSettings
+        # Set value using dot notation
+        success = settings.set('display.brightness', 80)
+        assert success == True
         
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            db = mock_database_manager
-            settings = SimpleSettings()
-            
-            # Set value using dot notation
-            success = settings.set('display.brightness', 80)
-            assert success == True
-            
-            # Verify value was set in database
-            value = db.get_setting('display', 'brightness')
-            assert value == 80
+        # Verify value was set in database
+        value = mock_database_manager.get_setting('display', 'brightness')
+        assert value == 80
 
     @pytest.mark.unit
-    def test_simple_settings_set_invalid_key(self, mock_database_manager):
+    def test_simple_settings_set_invalid_key(self, settings):
         """
         Test that SimpleSettings.set() raises a ValueError when given a key without a category.
         
         Verifies that attempting to set a value with an invalid key format (missing category) results in a ValueError.
         """
-        from utils.simple_settings import SimpleSettings
+        # Should raise ValueError for key without category
+        with pytest.raises(ValueError, match=_INVALID_KEY_RE):
+            settings.set('invalid_key', 'value')
+
+    @pytest.mark.unit
+    def test_simple_settings_set_many(self, settings, mock_database_manager):
+        """
+        Verify that SimpleSettings.set_many() stores several dot notation keys across categories, and rejects keys without a category.
+        """
+        success = settings.set_many({
+            'display.brightness': 60,
+            'display.sleep_timeout': 5,
+            'safety.max_o2_percentage': 40,
+        })
+        assert success == True
+        
+        assert mock_database_manager.get_setting('display', 'brightness') == 60
+        assert mock_database_manager.get_setting('display', 'sleep_timeout') == 5
+        assert mock_database_manager.get_setting('safety', 'max_o2_percentage') == 40
         
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            settings = SimpleSettings()
+        with pytest.raises(ValueError, match=_INVALID_KEY_RE):
+            settings.set_many({'invalid_key': 'value'})
+
+    @pytest.mark.unit
+    def test_simple_settings_set_many_notifies_once(self, settings, monkeypatch):
+        """
+        Verify that a bound settings callback is called once for a whole set_many() batch instead of once per key.
+        """
+        from utils.database_manager import DatabaseManager
+        
+        # A database with real event dispatching, so bound callbacks actually fire
+        db = DatabaseManager(':memory:')
+        monkeypatch.setattr('utils.simple_settings.db_manager', db)
+        
+        calls = []
+        
+        def callback(instance, values):
+            calls.append(values)
+        
+        settings.bind(settings=callback)
+        try:
+            settings.set_many({'display.brightness': 60, 'display.sleep_timeout': 5, 'display.auto_sleep': False})
+            assert len(calls) == 1
             
-            # Should raise ValueError for key without category
-            with pytest.raises(ValueError):
-                settings.set('invalid_key', 'value')
+            settings.set('display.brightness', 70)
+            assert len(calls) == 2
+        finally:
+            settings.unbind(settings=callback)
+            db.close()
 
     @pytest.mark.unit
-    def test_simple_settings_get_category(self, mock_database_manager):
+    def test_simple_settings_get_category(self, settings, mock_database_manager):
         """
         Tests that SimpleSettings.get() returns all key-value pairs for a given category as a dictionary.
         """
-        from utils.simple_settings import SimpleSettings
+        # Set multiple values in a category
+        mock_database_manager.set_setting('display', 'brightness', 75)
+        mock_database_manager.set_setting('display', 'sleep_timeout', 10)
         
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            db = mock_database_manager
-            settings = SimpleSettings()
-            
-            # Set multiple values in a category
-            db.set_setting('display', 'brightness', 75)
-            db.set_setting('display', 'sleep_timeout', 10)
-            
-            # Get entire category
-            category_settings = settings.get('display')
-            
-            assert isinstance(category_settings, dict)
-            assert category_settings['brightness'] == 75
-            assert category_settings['sleep_timeout'] == 10
+        # Get entire category
+        category_settings = settings.get('display')
+        
+        assert isinstance(category_settings, dict)
+        assert category_settings['brightness'] == 75
+        assert category_settings['sleep_timeout'] == 10
 
     @pytest.mark.unit
-    def test_simple_settings_factory_reset(self, mock_database_manager):
+    def test_simple_settings_factory_reset(self, settings, mock_database_manager):
         """
         Tests that the SimpleSettings.factory_reset() method restores settings to their default values and removes any custom values not present in the defaults.
         """
-        from utils.simple_settings import SimpleSettings
+        # Set some custom values
+        mock_database_manager.set_setting('test', 'custom_value', 'test')
         
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            db = mock_database_manager
-            settings = SimpleSettings()
-            
-            # Set some custom values
-            db.set_setting('test', 'custom_value', 'test')
-            
-            # Perform factory reset
-            success = settings.factory_reset()
-            assert success == True
-            
-            # Custom value should be gone (since it's not in defaults)
-            value = db.get_setting('test', 'custom_value')
-            assert value is None
+        # Perform factory reset
+        success = settings.factory_reset()
+        assert success == True
+        
+        # Custom value should be gone (since it's not in defaults)
+        value = mock_database_manager.get_setting('test', 'custom_value')
+        assert value is None
 
     @pytest.mark.unit
-    def test_simple_settings_default_settings_property(self, mock_database_manager):
+    def test_simple_settings_default_settings_property(self, settings):
         """
-        Verify that the SimpleSettings.default_settings property returns a dictionary containing expected categories.
+        Verify that the SimpleSettings.default_settings property returns a dictionary containing expected categories, and that editing it leaves the defaults intact.
         """
-        from utils.simple_settings import SimpleSettings
+        defaults = settings.default_settings
+        assert isinstance(defaults, dict)
+        assert 'display' in defaults
+        assert 'app' in defaults
         
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            settings = SimpleSettings()
-            
-            defaults = settings.default_settings
-            assert isinstance(defaults, dict)
-            assert 'display' in defaults
-            assert 'app' in defaults
+        # Each read is an independent copy
+        defaults['display']['brightness'] = -1
+        assert settings.default_settings['display']['brightness'] != -1
 
     @pytest.mark.unit
-    def test_settings_data_type_preservation(self, mock_database_manager):
+    @pytest.mark.parametrize("key,value", _TYPE_CASES)
+    def test_settings_data_type_preservation(self, settings, key, value):
         """
-        Verify that various data types are correctly preserved when storing and retrieving settings using SimpleSettings.
+        Verify that a value of each supported data type is preserved when storing and retrieving it using SimpleSettings.
         
-        This test sets and retrieves boolean, integer, float, string, dictionary, and list values, asserting that both the value and its type remain unchanged.
+        Covers boolean, integer, float, string, dictionary, and list values, asserting that both the value and its type remain unchanged.
         """
-        from utils.simple_settings import SimpleSettings
+        success = settings.set(f'test.{key}', value)
+        assert success == True
         
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            db = mock_database_manager
-            settings = SimpleSettings()
-            
-            # Test different data types
-            test_values = {
-                'bool_value': True,
-                'int_value': 42,
-                'float_value': 3.14,
-                'str_value': 'hello',
-                'dict_value': {'key': 'value'},
-                'list_value': [1, 2, 3]
-            }
-            
-            # Set values
-            for key, value in test_values.items():
-                success = settings.set(f'test.{key}', value)
-                assert success == True
-            
-            # Verify types are preserved
-            for key, expected_value in test_values.items():
-                retrieved_value = settings.get(f'test.{key}')
-                assert retrieved_value == expected_value
-                assert type(retrieved_value) == type(expected_value)
+        retrieved_value = settings.get(f'test.{key}')
+        assert retrieved_value == value
+        assert type(retrieved_value) == type(value)
 
     @pytest.mark.unit
-    def test_settings_dot_notation_edge_cases(self, mock_database_manager):
+    def test_settings_dot_notation_edge_cases(self, settings):
         """
         Test that setting and getting keys with multiple dots in dot notation only splits on the first dot.
         
         Verifies that the SimpleSettings class correctly interprets keys with multiple dots by treating only the first dot as the separator between category and key.
         """
-        from utils.simple_settings import SimpleSettings
+        # Test multiple dots (should only split on first)
+        success = settings.set('category.sub.key', 'value')
+        assert success == True
         
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            settings = SimpleSettings()
+        value = settings.get('category.sub.key')
+        assert value == 'value'
+
+    @pytest.mark.unit
+    @pytest.mark.xdist_group('settings_threads')
+    def test_settings_concurrent_access(self, settings, thread_pool):
+        """
+        Verifies that concurrent threads can safely set and get settings values without data corruption or race conditions.
+        
+        Each worker writes to its own category, so the check covers both per-thread consistency and the final stored values.
+        """
+        def worker(thread_id):
+            """
+            Performs repeated set and get operations on a thread-specific settings key to test concurrent access.
             
-            # Test multiple dots (should only split on first)
-            success = settings.set('category.sub.key', 'value')
-            assert success == True
+            Parameters:
+                thread_id (int): Identifier for the thread, used to create a unique settings category.
             
-            value = settings.get('category.sub.key')
-            assert value == 'value'
+            Returns:
+                int: The last value the worker read back.
+            """
+            key = f'thread_{thread_id}.value'
+            for i in range(10):
+                settings.set(key, i)
+                value = settings.get(key)
+                assert value == i
+            return value
+        
+        # map() re-raises any assertion error from a worker in this thread
+        results = list(thread_pool.map(worker, range(16)))
+        
+        assert results == [9] * 16
+        for thread_id in range(16):
+            assert settings.get(f'thread_{thread_id}.value') == 9
 
-    @pytest.mark.unit  
-    def test_settings_concurrent_access(self, mock_database_manager):
+    @pytest.mark.unit
+    @pytest.mark.xdist_group('settings_threads')
+    def test_settings_concurrent_shared_key(self, settings, thread_pool):
         """
-        Verifies that concurrent threads can safely set and get settings values without data corruption or race conditions.
+        Verify that threads hammering the same settings key never raise and only ever read back a value one of them wrote.
         """
-        from utils.simple_settings import SimpleSettings
+        written = set(range(8 * 10))
         
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            settings = SimpleSettings()
+        def worker(thread_id):
+            """
+            Repeatedly write a thread-specific value to the shared key and read the key back.
             
-            def worker(thread_id):
-                """
-                Performs repeated set and get operations on a thread-specific settings key to test concurrent access.
-                
-                Parameters:
-                    thread_id (int): Identifier for the thread, used to create a unique settings key.
-                """
-                for i in range(10):
-                    settings.set(f'test.thread_{thread_id}', i)
-                    value = settings.get(f'test.thread_{thread_id}')
-                    assert value == i
+            Parameters:
+                thread_id (int): Identifier for the thread, used to derive the values it writes.
+            """
+            for i in range(10):
+                settings.set('test.shared', thread_id * 10 + i)
+                assert settings.get('test.shared') in written
+        
+        list(thread_pool.map(worker, range(8)))
+        
+        assert settings.get('test.shared') in written
+
+    @pytest.mark.unit
+    def test_settings_bind_and_unbind(self, settings, mock_database_manager):
+        """
+        Verify that a settings callback is registered with the database manager once, however often it is bound, and that unbind removes it again.
+        """
+        observers_before = len(mock_database_manager.get_property_observers('on_data_changed'))
+        
+        def callback(instance, values):
+            pass
+        
+        settings.bind(settings=callback)
+        settings.bind(settings=callback)
+        assert len(mock_database_manager.get_property_observers('on_data_changed')) == observers_before + 1
+        
+        settings.unbind(settings=callback)
+        settings.unbind(settings=callback)
+        assert len(mock_database_manager.get_property_observers('on_data_changed')) == observers_before
+
+    @pytest.mark.unit
+    def test_settings_unbind_after_db_swap(self, settings, mock_database_manager, monkeypatch):
+        """
+        Verify that a callback follows a replaced database manager and is unbound from the manager it was bound to, leaving other observers alone.
+        """
+        from utils.database_manager import DatabaseManager
+        
+        def callback(instance, values):
+            pass
+        
+        observers_before = len(mock_database_manager.get_property_observers('on_data_changed'))
+        settings.bind(settings=callback)
+        
+        other = DatabaseManager(':memory:')
+        try:
+            other_uid = other.fbind('on_data_changed', lambda *args: None)
+            monkeypatch.setattr('utils.simple_settings.db_manager', other)
             
-            threads = []
-            for i in range(3):
-                t = threading.Thread(target=worker, args=(i,))
-                threads.append(t)
-                t.start()
+            settings.bind(settings=callback)
+            assert len(mock_database_manager.get_property_observers('on_data_changed')) == observers_before
+            assert len(other.get_property_observers('on_data_changed')) == 2
             
-            for t in threads:
-                t.join()
+            settings.unbind(settings=callback)
+            assert len(other.get_property_observers('on_data_changed')) == 1
+            other.unbind_uid('on_data_changed', other_uid)
+        finally:
+            other.close()
 
     @pytest.mark.unit
     def test_settings_global_instance(self, mock_database_manager):
         """
         Verify that the global settings_manager instance can set and retrieve values correctly using the mock database manager.
         """
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            from utils.simple_settings import settings_manager
-            
-            # Test that global instance works
-            success = settings_manager.set('global.test', 'value')
-            assert success == True
-            
-            value = settings_manager.get('global.test')
-            assert value == 'value'
+        from utils.simple_settings import settings_manager
+        
+        # Test that global instance works
+        success = settings_manager.set('global.test', 'value')
+        assert success == True
+        
+        value = settings_manager.get('global.test')
+        assert value == 'value'
 
     @pytest.mark.integration
     def test_settings_database_integration(self, mock_database_manager):
         """
         Verifies that the settings manager correctly interacts with the database manager by storing values in the database during integration.
         """
-        with patch('utils.simple_settings.db_manager', mock_database_manager):
-            from utils.simple_settings import settings_manager
-            
-            # Test that settings manager uses the database
-            settings_manager.set('integration.test', 'database_value')
-            
-            # Should be stored in database
-            db_value = mock_database_manager.get_setting('integration', 'test')
-            assert db_value == 'database_value'
+        from utils.simple_settings import settings_manager
+        
+        # Test that settings manager uses the database
+        settings_manager.set('integration.test', 'database_value')
+        
+        # Should be stored in database
+        db_value = mock_database_manager.get_setting('integration', 'test')
+        assert db_value == 'database_value'
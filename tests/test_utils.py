@@ -3,72 +3,147 @@ Test utilities and helpers for the Trimix Analyzer test suite.
 """
 
 import os
-import tempfile
-import shutil
+import copy
+import operator
+import random
 from datetime import datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
 from typing import Dict, Any, List
-from unittest.mock import MagicMock
+
+
+# Content written to every sample file by create_test_file_structure()
+_TEST_FILE_CONTENT = b'test content'
+
+# Precomputed age offsets and calibration notes for the test data generators
+_MINUTE_OFFSETS = tuple(timedelta(minutes=i) for i in range(256))
+_MONTH_OFFSETS = tuple(timedelta(days=i * 30) for i in range(64))
+_CAL_NOTES = tuple(f'Test calibration {i + 1}' for i in range(1024))
+
+# Random source shared by the test data generators
+_RNG = random.Random()
+
+
+# Canonical settings returned by TestDataGenerator.generate_settings_data()
+_SETTINGS_TEMPLATE = MappingProxyType({
+    'app': {
+        'first_run': False,
+        'app_version': '1.0.0',
+        'theme': 'dark',
+        'language': 'en',
+        'debug_mode': False,
+        'last_screen': 'home'
+    },
+    'display': {
+        'brightness': 75,
+        'sleep_timeout': 10,
+        'auto_brightness': True
+    },
+    'wifi': {
+        'auto_connect': True,
+        'remember_networks': True,
+        'scan_interval': 30,
+        'last_network': 'TestNetwork'
+    },
+    'sensors': {
+        'calibration_interval_days': 30,
+        'auto_calibration_reminder': True,
+        'o2_calibration_offset': 0.1,
+        'he_calibration_offset': -0.05,
+        'auto_calibrate': True
+    },
+    'safety': {
+        'max_o2_percentage': 100,
+        'max_he_percentage': 85,
+        'warning_thresholds': {
+            'high_o2': 23.0,
+            'low_o2': 19.0,
+            'high_he': 50.0
+        }
+    },
+    'units': {
+        'pressure': 'bar',
+        'temperature': 'celsius',
+        'depth': 'meters'
+    }
+})
+
+
+# (key, low, high) bounds checked by TestAssertions.assert_sensor_reading_valid()
+_READING_BOUNDS = (
+    ('o2', 0, 100),
+    ('temp', -50, 100),
+    ('press', 0.5, 2.0),
+    ('hum', 0, 100),
+)
+_get_reading_values = operator.itemgetter(*(key for key, _, _ in _READING_BOUNDS))
+_NUMERIC_TYPES = frozenset((int, float))
+
+# Categories TestAssertions.assert_settings_structure_valid() requires
+_EXPECTED_CATEGORIES = frozenset({'app', 'display', 'wifi', 'sensors', 'safety', 'units'})
 
 
 class MockSensorInterface:
     """Mock sensor interface for testing."""
     
+    __slots__ = (
+        'o2_voltage', 'o2_percent', 'co2_voltage', 'co2_ppm',
+        'temperature', 'pressure', 'humidity', 'button_pressed'
+    )
+    
     def __init__(self):
         """
         Initialize the mock sensor interface with default sensor readings for testing purposes.
         """
-        self.mock_data = {
-            'o2_voltage': 1.5,
-            'o2_percent': 21.0,
-            'co2_voltage': 0.5,
-            'co2_ppm': 400,
-            'temperature': 25.0,
-            'pressure': 1.013,
-            'humidity': 45.0,
-            'button_pressed': False
-        }
+        self.o2_voltage = 1.5
+        self.o2_percent = 21.0
+        self.co2_voltage = 0.5
+        self.co2_ppm = 400
+        self.temperature = 25.0
+        self.pressure = 1.013
+        self.humidity = 45.0
+        self.button_pressed = False
     
     def read_oxygen_voltage(self) -> float:
         """
         Return the current mock oxygen sensor voltage value.
         """
-        return self.mock_data['o2_voltage']
+        return self.o2_voltage
     
     def read_oxygen_percent(self) -> float:
         """
         Return the current mock oxygen percentage value.
         """
-        return self.mock_data['o2_percent']
+        return self.o2_percent
     
     def read_co2_voltage(self) -> float:
         """
         Return the current mock CO2 sensor voltage value.
         """
-        return self.mock_data['co2_voltage']
+        return self.co2_voltage
     
     def read_co2_ppm(self) -> float:
         """
         Return the current mock CO2 concentration in parts per million (ppm).
         """
-        return self.mock_data['co2_ppm']
+        return self.co2_ppm
     
     def read_temperature_c(self) -> float:
         """
         Return the current mock temperature value in degrees Celsius.
         """
-        return self.mock_data['temperature']
+        return self.temperature
     
     def read_pressure_hpa(self) -> float:
         """
         Returns the current mock pressure value in hectopascals (hPa).
         """
-        return self.mock_data['pressure']
+        return self.pressure
     
     def read_humidity_pct(self) -> float:
         """
         Return the current mock humidity value as a percentage.
         """
-        return self.mock_data['humidity']
+        return self.humidity
     
     def is_power_button_pressed(self) -> bool:
         """
@@ -77,7 +152,7 @@ class MockSensorInterface:
         Returns:
             bool: True if the mock power button is pressed, False otherwise.
         """
-        return self.mock_data['button_pressed']
+        return self.button_pressed
     
     def set_mock_data(self, **kwargs):
         """
@@ -85,8 +160,12 @@ class MockSensorInterface:
         
         Parameters:
         	**kwargs: Key-value pairs representing mock sensor data fields to update.
+        
+        Raises:
+            AttributeError: If a keyword does not name a mock sensor data field.
         """
-        self.mock_data.update(kwargs)
+        for name, value in kwargs.items():
+            setattr(self, name, value)
 
 
 class TestDataGenerator:
@@ -103,104 +182,69 @@ class TestDataGenerator:
         Returns:
             List[Dict[str, Any]]: List of sensor readings, each containing a timestamp and randomized sensor values.
         """
-        import random
-        
-        readings = []
         base_time = datetime.now()
-        
-        for i in range(count):
-            reading = {
-                'timestamp': base_time - timedelta(minutes=i),
-                'o2': 20.9 + random.uniform(-0.5, 0.5),
-                'temp': 25.0 + random.uniform(-2.0, 2.0),
-                'press': 1.013 + random.uniform(-0.05, 0.05),
-                'hum': 45.0 + random.uniform(-5.0, 5.0)
-            }
-            readings.append(reading)
-        
-        return readings
+        uniform = _RNG.uniform
+        
+        # Draw each field's noise in one pass, then zip the columns into readings
+        timestamps = [
+            base_time - (_MINUTE_OFFSETS[i] if i < len(_MINUTE_OFFSETS) else timedelta(minutes=i))
+            for i in range(count)
+        ]
+        o2 = [20.9 + uniform(-0.5, 0.5) for _ in range(count)]
+        temp = [25.0 + uniform(-2.0, 2.0) for _ in range(count)]
+        press = [1.013 + uniform(-0.05, 0.05) for _ in range(count)]
+        hum = [45.0 + uniform(-5.0, 5.0) for _ in range(count)]
+        
+        return [
+            {'timestamp': t, 'o2': o, 'temp': tc, 'press': p, 'hum': h}
+            for t, o, tc, p, h in zip(timestamps, o2, temp, press, hum)
+        ]
     
     @staticmethod
-    def generate_calibration_history(sensor_type: str, count: int = 5) -> List[Dict[str, Any]]:
+    def generate_calibration_history(sensor_type: str, count: int = 5, rng=None) -> List[Dict[str, Any]]:
         """
         Generate a list of synthetic calibration history records for a specified sensor type.
         
         Parameters:
         	sensor_type (str): The type of sensor for which to generate calibration records.
         	count (int, optional): The number of calibration records to generate. Defaults to 5.
+        	rng (random.Random, optional): Random source for the readings. Defaults to the shared test data generator.
         
         Returns:
         	List[Dict[str, Any]]: A list of calibration records, each containing sensor type, calibration date, voltage reading, temperature, and notes.
         """
-        import random
-        
+        uniform = (rng or _RNG).uniform
         history = []
         base_time = datetime.now()
         
         for i in range(count):
             calibration = {
                 'sensor_type': sensor_type,
-                'calibration_date': base_time - timedelta(days=i * 30),
-                'voltage_reading': 1.5 + random.uniform(-0.2, 0.2),
-                'temperature': 25.0 + random.uniform(-3.0, 3.0),
-                'notes': f'Test calibration {i + 1}'
+                'calibration_date': base_time - (_MONTH_OFFSETS[i] if i < len(_MONTH_OFFSETS) else timedelta(days=i * 30)),
+                'voltage_reading': 1.5 + uniform(-0.2, 0.2),
+                'temperature': 25.0 + uniform(-3.0, 3.0),
+                'notes': _CAL_NOTES[i] if i < len(_CAL_NOTES) else f'Test calibration {i + 1}'
             }
             history.append(calibration)
         
         return history
     
     @staticmethod
-    def generate_settings_data() -> Dict[str, Dict[str, Any]]:
+    def generate_settings_data(mutable: bool = True) -> Dict[str, Dict[str, Any]]:
         """
         Return a nested dictionary representing comprehensive application settings for testing purposes.
         
         The returned settings include categories for app configuration, display, Wi-Fi, sensors, safety, and measurement units, each populated with representative values.
+        
+        Parameters:
+            mutable (bool): If True (the default), return a deep copy the caller may modify. If False, return the shared read-only template without copying.
          
         Returns:
             settings (Dict[str, Dict[str, Any]]): Nested dictionary containing mock settings data for all major configuration categories.
         """
-        return {
-            'app': {
-                'first_run': False,
-                'app_version': '1.0.0',
-                'theme': 'dark',
-                'language': 'en',
-                'debug_mode': False,
-                'last_screen': 'home'
-            },
-            'display': {
-                'brightness': 75,
-                'sleep_timeout': 10,
-                'auto_brightness': True
-            },
-            'wifi': {
-                'auto_connect': True,
-                'remember_networks': True,
-                'scan_interval': 30,
-                'last_network': 'TestNetwork'
-            },
-            'sensors': {
-                'calibration_interval_days': 30,
-                'auto_calibration_reminder': True,
-                'o2_calibration_offset': 0.1,
-                'he_calibration_offset': -0.05,
-                'auto_calibrate': True
-            },
-            'safety': {
-                'max_o2_percentage': 100,
-                'max_he_percentage': 85,
-                'warning_thresholds': {
-                    'high_o2': 23.0,
-                    'low_o2': 19.0,
-                    'high_he': 50.0
-                }
-            },
-            'units': {
-                'pressure': 'bar',
-                'temperature': 'celsius',
-                'depth': 'meters'
-            }
-        }
+        if not mutable:
+            return _SETTINGS_TEMPLATE
+        return copy.deepcopy(dict(_SETTINGS_TEMPLATE))
 
 
 class DatabaseTestHelper:
@@ -214,6 +258,8 @@ class DatabaseTestHelper:
         Returns:
             str: The file path to the created temporary database file.
         """
+        import tempfile
+        
         temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
         temp_db.close()
         return temp_db.name
@@ -232,86 +278,54 @@ class DatabaseTestHelper:
     @staticmethod
     def populate_test_data(db_manager, test_data: Dict[str, Any]):
         """
-        Inserts test settings data into the database using the provided database manager.
+        Inserts test settings data into the database using the provided database manager, in a single transaction.
         
         Parameters:
             test_data (Dict[str, Any]): A dictionary mapping categories to their respective settings and values.
         """
-        for category, settings in test_data.items():
-            for key, value in settings.items():
-                db_manager.set_setting(category, key, value)
+        db_manager.set_settings_bulk(test_data)
     
     @staticmethod
     def verify_database_integrity(db_manager) -> bool:
         """
-        Checks whether the database manager supports basic set, get, and category retrieval operations.
+        Checks the database with SQLite's quick integrity check, then verifies that a setting written through the database manager reads back from SQLite itself.
+        
+        Parameters:
+            db_manager: A DatabaseManager instance, or a database path (":memory:" skips the filesystem entirely) to open one; a manager opened here is closed again.
         
         Returns:
             bool: True if all operations succeed and return expected results; False otherwise.
         """
+        opened = isinstance(db_manager, str)
         try:
-            # Test basic operations
+            if opened:
+                from utils.database_manager import DatabaseManager
+                db_manager = DatabaseManager(db_manager)
+            
+            # Let SQLite check its own structures in a single statement
+            if db_manager.connection.execute('PRAGMA quick_check').fetchone()[0] != 'ok':
+                return False
+            
+            # Smoke-test a single round trip; get_setting would be answered from the
+            # manager's settings cache, so read the row back from SQLite directly
             test_key = 'integrity_test'
             test_value = 'test_value'
             
-            # Set and get a value
             success = db_manager.set_setting('test', test_key, test_value)
             if not success:
                 return False
             
-            retrieved_value = db_manager.get_setting('test', test_key)
-            if retrieved_value != test_value:
-                return False
-            
-            # Test category retrieval
-            category = db_manager.get_settings_category('test')
-            if not isinstance(category, dict):
-                return False
-            
-            return True
+            row = db_manager.connection.execute(
+                'SELECT value FROM settings WHERE category = ? AND key = ?', ('test', test_key)
+            ).fetchone()
+            return row is not None and row[0] == test_value
         
         except Exception:
             return False
-
-
-class EnvironmentManager:
-    """Manage test environment setup and cleanup."""
-    
-    def __init__(self):
-        """
-        Initialize the EnvironmentManager and store a dictionary for original environment variables.
-        """
-        self.original_env = {}
-    
-    def setup_test_environment(self):
-        """
-        Sets up environment variables required for testing, saving original values for later restoration.
-        
-        This method sets specific environment variables to enable test mode and mock sensors, while preserving any existing values so they can be restored after tests.
-        """
-        # Store original environment
-        test_vars = ['TRIMIX_ENVIRONMENT', 'TRIMIX_MOCK_SENSORS', 'TRIMIX_TEST_DB_PATH']
-        for var in test_vars:
-            if var in os.environ:
-                self.original_env[var] = os.environ[var]
-        
-        # Set test environment
-        os.environ['TRIMIX_ENVIRONMENT'] = 'test'
-        os.environ['TRIMIX_MOCK_SENSORS'] = '1'
-    
-    def cleanup_test_environment(self):
-        """
-        Restores the original environment variables after test modifications by removing test-specific variables and resetting any previously saved values.
-        """
-        # Remove test variables
-        test_vars = ['TRIMIX_ENVIRONMENT', 'TRIMIX_MOCK_SENSORS', 'TRIMIX_TEST_DB_PATH']
-        for var in test_vars:
-            if var in os.environ:
-                del os.environ[var]
         
-        # Restore original values
-        for var, value in self.original_env.items():
-            os.environ[var] = value
+        finally:
+            if opened and not isinstance(db_manager, str):
+                db_manager.close()
 
 
 class TestAssertions:
@@ -324,17 +338,12 @@ class TestAssertions:
         
         Raises an AssertionError if any key is missing, has an invalid type, or its value falls outside the expected range.
         """
-        required_keys = ['o2', 'temp', 'press', 'hum']
-        
-        for key in required_keys:
-            assert key in reading, f"Missing key: {key}"
-            assert isinstance(reading[key], (int, float)), f"Invalid type for {key}: {type(reading[key])}"
+        missing = [key for key, _, _ in _READING_BOUNDS if key not in reading]
+        assert not missing, f"Missing key: {', '.join(missing)}"
         
-        # Check value ranges
-        assert 0 <= reading['o2'] <= 100, f"O2 out of range: {reading['o2']}"
-        assert -50 <= reading['temp'] <= 100, f"Temperature out of range: {reading['temp']}"
-        assert 0.5 <= reading['press'] <= 2.0, f"Pressure out of range: {reading['press']}"
-        assert 0 <= reading['hum'] <= 100, f"Humidity out of range: {reading['hum']}"
+        for (key, low, high), value in zip(_READING_BOUNDS, _get_reading_values(reading)):
+            assert type(value) in _NUMERIC_TYPES, f"Invalid type for {key}: {type(value)}"
+            assert low <= value <= high, f"{key} out of range: {value}"
     
     @staticmethod
     def assert_calibration_data_valid(calibration: Dict[str, Any]):
@@ -364,11 +373,17 @@ class TestAssertions:
         
         Raises an AssertionError if any expected category is missing or not a dictionary.
         """
-        expected_categories = ['app', 'display', 'wifi', 'sensors', 'safety', 'units']
+        missing = _EXPECTED_CATEGORIES - settings.keys()
+        assert not missing, f"Missing settings category: {', '.join(sorted(missing))}"
         
-        for category in expected_categories:
-            assert category in settings, f"Missing settings category: {category}"
-            assert isinstance(settings[category], dict), f"Invalid type for category {category}"
+        invalid = [category for category in _EXPECTED_CATEGORIES if not isinstance(settings[category], dict)]
+        assert not invalid, f"Invalid type for category {', '.join(sorted(invalid))}"
+
+
+def _noop(*args, **kwargs):
+    """
+    Accept any arguments and do nothing; stands in for Kivy callbacks and bindings.
+    """
 
 
 class MockKivyComponents:
@@ -377,36 +392,34 @@ class MockKivyComponents:
     @staticmethod
     def mock_app():
         """
-        Return a mock Kivy App instance with stubbed `build` and `on_start` methods for UI testing.
+        Return a stub Kivy App instance with `build` and `on_start` methods for UI testing.
+        
+        Returns:
+            SimpleNamespace: A stub app whose `build()` returns a stub root widget and whose `on_start()` returns None.
         """
-        app = MagicMock()
-        app.build.return_value = MagicMock()
-        app.on_start.return_value = None
-        return app
+        return SimpleNamespace(build=lambda: MockKivyComponents.mock_widget(), on_start=_noop)
     
     @staticmethod
     def mock_screen():
         """
-        Return a mocked Kivy screen object with a mock manager attribute for use in UI-related tests.
+        Return a stub Kivy screen object with a stub manager attribute for use in UI-related tests.
         
         Returns:
-            MagicMock: A mock screen object with a mocked 'manager' attribute.
+            SimpleNamespace: A stub screen object with a 'manager' attribute.
         """
-        screen = MagicMock()
-        screen.manager = MagicMock()
-        return screen
+        return SimpleNamespace(manager=SimpleNamespace(current=None))
     
     @staticmethod
     def mock_widget():
         """
-        Return a mock Kivy widget object with a mocked `bind` method for use in UI-related tests.
+        Return a stub Kivy widget object with a no-op `bind` method for use in UI-related tests.
+        
+        Tests that need to inspect calls should use `MagicMock(spec=...)` instead.
         
         Returns:
-            MagicMock: A mock widget instance with a mocked `bind` method.
+            SimpleNamespace: A stub widget instance with a no-op `bind` method.
         """
-        widget = MagicMock()
-        widget.bind = MagicMock()
-        return widget
+        return SimpleNamespace(bind=_noop)
 
 
 def create_test_file_structure(base_path: str) -> Dict[str, str]:
@@ -415,6 +428,8 @@ def create_test_file_structure(base_path: str) -> Dict[str, str]:
     
     Creates 'config', 'data', 'logs', and 'backups' subdirectories under the specified base path, and generates sample files in the 'config', 'data', and 'logs' folders. Returns a dictionary mapping folder and file names to their full paths.
     
+    Pass a pytest `tmp_path` as the base path so pytest removes the structure automatically.
+    
     Parameters:
         base_path (str): The root directory where the test structure will be created.
     
@@ -439,20 +454,13 @@ def create_test_file_structure(base_path: str) -> Dict[str, str]:
         'log_file': os.path.join(structure['logs'], 'test.log')
     }
     
+    # Unbuffered writes: one open/write/close per file, no text-layer setup
     for file_path in test_files.values():
-        with open(file_path, 'w') as f:
-            f.write('test content')
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, _TEST_FILE_CONTENT)
+        finally:
+            os.close(fd)
     
     structure.update(test_files)
     return structure
-
-
-def cleanup_test_file_structure(base_path: str):
-    """
-    Recursively deletes the test file structure at the specified base path if it exists.
-    
-    Parameters:
-        base_path (str): The root directory of the test file structure to remove.
-    """
-    if os.path.exists(base_path):
-        shutil.rmtree(base_path)
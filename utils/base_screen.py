@@ -3,29 +3,122 @@ Base screen class with common functionality for all Trimix screens.
 Provides standard navigation, settings access, and error handling.
 """
 
+from functools import lru_cache
 from kivy.uix.screenmanager import Screen
 from kivy.logger import Logger
+from kivy.clock import Clock
+from kivy.lang import Builder
+from kivy.factory import Factory
 from kivy.uix.popup import Popup
-from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.label import Label
-from kivy.uix.button import Button
 from utils.database_manager import db_manager
 from utils.simple_settings import settings_manager
 
 
+# Dialog layouts, compiled once at import and instantiated through Factory
+Builder.load_string('''
+<ErrorPopupContent@BoxLayout>:
+    orientation: 'vertical'
+    spacing: '10dp'
+    padding: '20dp'
+    Label:
+        id: message_label
+        text_size: 400, None
+        halign: 'center'
+        valign: 'middle'
+    Button:
+        id: close_button
+        text: 'OK'
+        size_hint_y: None
+        height: '40dp'
+
+<ConfirmPopupContent@BoxLayout>:
+    orientation: 'vertical'
+    spacing: '15dp'
+    padding: '20dp'
+    Label:
+        id: message_label
+        halign: 'center'
+    BoxLayout:
+        orientation: 'horizontal'
+        spacing: '10dp'
+        size_hint_y: None
+        height: '50dp'
+        Button:
+            id: cancel_button
+            text: 'Cancel'
+            size_hint_x: 0.5
+        Button:
+            id: confirm_button
+            text: 'Confirm'
+            size_hint_x: 0.5
+            background_color: 0.2, 0.6, 0.2, 1
+''')
+
+
+@lru_cache(maxsize=128, typed=True)
+def _range_msgs(min_val, max_val, type_name):
+    """
+    Build the validation messages for a numeric input, cached per bounds and type.
+    
+    typed=True keeps 0 and 0.0 apart, since they format differently.
+    
+    Returns:
+        tuple: The too-small, too-large and invalid-input messages.
+    """
+    return (
+        f"Value must be at least {min_val}",
+        f"Value must be at most {max_val}",
+        f"Please enter a valid {type_name}",
+    )
+
+
+def _int_fast(value):
+    """
+    Convert plain keypad input to an int without going through int()'s error path.
+    
+    Returns:
+        int or None: The converted value, or None if the input needs the general conversion.
+    """
+    if type(value) is int:
+        return value
+    if type(value) is str and value.removeprefix('-').isdecimal():
+        return int(value)
+    return None
+
+
+@lru_cache(maxsize=32)
+def _reset_texts(settings_category):
+    """
+    Build the title and message of a category reset confirmation, cached per category.
+    
+    Returns:
+        tuple: The dialog title and message.
+    """
+    return (
+        f"Reset {settings_category.title()} Settings",
+        f"Reset all {settings_category} settings to factory defaults?\n\nThis action cannot be undone.",
+    )
+
+
 class BaseScreen(Screen):
     """
     Base class for all Trimix screens.
     Provides common functionality like navigation, settings access, and error handling.
     """
     
-    def __init__(self, **kwargs):
+    # Log prefix naming the concrete screen class; set per subclass below
+    _log_prefix = 'BaseScreen'
+    
+    # The global managers, shared by every screen rather than stored per instance
+    db_manager = db_manager
+    settings_manager = settings_manager
+    
+    def __init_subclass__(cls, **kwargs):
         """
-        Initializes the base screen with references to the database and settings managers.
+        Record the subclass name once as its log prefix.
         """
-        super().__init__(**kwargs)
-        self.db_manager = db_manager
-        self.settings_manager = settings_manager
+        super().__init_subclass__(**kwargs)
+        cls._log_prefix = cls.__name__
     
     def navigate_back(self):
         """
@@ -33,33 +126,36 @@ class BaseScreen(Screen):
         
         Override this method in subclasses to customize back navigation behavior.
         """
-        if hasattr(self.manager, 'previous_screen'):
-            self.manager.current = self.manager.previous_screen
-        else:
-            self.manager.current = 'home'
+        # TrimixScreenManager always has previous_screen; a plain ScreenManager falls back to home
+        self.manager.current = getattr(self.manager, 'previous_screen', None) or 'home'
     
     def navigate_to(self, screen_name: str):
         """
         Navigates to the specified screen and stores the current screen for back navigation.
         
-        If navigation fails, logs the error and displays an error popup to the user.
+        If the screen is unknown to the manager, logs the error and displays an error popup to the user. Navigating to the screen that is already shown does nothing.
         """
-        try:
-            # Store current screen as previous for back navigation
-            if hasattr(self.manager, 'current'):
-                self.manager.previous_screen = self.manager.current
-            
-            self.manager.current = screen_name
-            Logger.info(f"BaseScreen: Navigated to {screen_name}")
-            
-        except Exception as e:
-            Logger.error(f"BaseScreen: Navigation to {screen_name} failed: {e}")
+        # Re-setting current would still dispatch and overwrite previous_screen
+        if self.manager.current == screen_name:
+            return
+        
+        if not self.manager.has_screen(screen_name):
+            Logger.error("BaseScreen: Navigation to %s failed: no such screen", screen_name)
             self.show_error("Navigation Error", f"Failed to navigate to {screen_name}")
+            return
+        
+        # Store current screen as previous for back navigation
+        self.manager.previous_screen = self.manager.current
+        
+        self.manager.current = screen_name
+        Logger.info("BaseScreen: Navigated to %s", screen_name)
     
     def get_setting(self, category: str, key: str, default=None):
         """
         Retrieve a setting value from the database manager, returning a default if retrieval fails.
         
+        Repeated reads are cheap, since the database manager answers them from its write-through settings cache.
+        
         Parameters:
             category (str): The category under which the setting is stored.
             key (str): The specific setting key.
@@ -71,7 +167,7 @@ class BaseScreen(Screen):
         try:
             return self.db_manager.get_setting(category, key, default)
         except Exception as e:
-            Logger.error(f"BaseScreen: Failed to get setting {category}.{key}: {e}")
+            Logger.error("BaseScreen: Failed to get setting %s.%s: %s", category, key, e)
             return default
     
     def set_setting(self, category: str, key: str, value):
@@ -84,49 +180,131 @@ class BaseScreen(Screen):
         try:
             return self.db_manager.set_setting(category, key, value)
         except Exception as e:
-            Logger.error(f"BaseScreen: Failed to set setting {category}.{key}: {e}")
+            Logger.error("BaseScreen: Failed to set setting %s.%s: %s", category, key, e)
             self.show_error("Settings Error", f"Failed to save {key} setting")
             return False
     
-    def show_error(self, title: str, message: str):
+    # Dialogs are built on first use and reused by the same screen afterwards; None while
+    # the cached dialog is animating closed, since Kivy cannot reopen it until it is gone
+    _error_popup = None
+    _confirm_popup = None
+    # (popup, on_cancel, on_confirm) bound to the open confirmation dialog's buttons
+    _confirm_handlers = None
+    
+    def _track_popup(self, popup, attr):
         """
-        Displays a standardized error popup dialog with a given title and message.
+        Keep a cached dialog out of use from its dismissal until it has left the window, then offer it for reuse again.
         
-        The popup includes an OK button to dismiss it. Logs the error message as a warning. If popup creation fails, logs the exception.
+        Parameters:
+            popup: The dialog to track.
+            attr (str): The screen attribute that caches it.
         """
-        try:
-            content = BoxLayout(orientation='vertical', spacing='10dp', padding='20dp')
-            
-            content.add_widget(Label(
-                text=message,
-                text_size=(400, None),
-                halign='center',
-                valign='middle'
-            ))
+        popup.fbind('on_dismiss', self._popup_dismissing, attr)
+        popup.fbind('_window', self._popup_closed, attr)
+    
+    def _popup_dismissing(self, attr, popup):
+        """
+        Stop handing out a dialog that has started to close, so the next one is built fresh.
+        """
+        if getattr(self, attr) is popup:
+            setattr(self, attr, None)
+    
+    def _popup_closed(self, attr, popup, window):
+        """
+        Cache a fully closed dialog again unless a replacement was built meanwhile.
+        """
+        if window is None and getattr(self, attr) is None:
+            setattr(self, attr, popup)
+    
+    def _get_error_popup(self):
+        """
+        Return this screen's error popup, building its widget tree when none is available.
+        
+        Returns:
+            Popup: The error popup; its content ids hold the message label.
+        """
+        if self._error_popup is None:
+            content = Factory.ErrorPopupContent()
             
-            close_btn = Button(
-                text='OK',
-                size_hint_y=None,
-                height='40dp'
+            popup = Popup(
+                content=content,
+                size_hint=(0.8, 0.4),
+                auto_dismiss=False
             )
+            content.ids.close_button.bind(on_press=popup.dismiss)
+            
+            self._track_popup(popup, '_error_popup')
+            self._error_popup = popup
+        
+        return self._error_popup
+    
+    def _get_confirm_popup(self):
+        """
+        Return this screen's confirmation popup, building its widget tree when none is available.
+        
+        Returns:
+            Popup: The confirmation popup; its content ids hold the message label and the buttons.
+        """
+        if self._confirm_popup is None:
+            content = Factory.ConfirmPopupContent()
             
             popup = Popup(
-                title=title,
                 content=content,
-                size_hint=(0.8, 0.4),
+                size_hint=(0.8, 0.5),
                 auto_dismiss=False
             )
+            popup.fbind('on_dismiss', self._release_confirm_handlers)
             
-            close_btn.bind(on_press=popup.dismiss)
-            content.add_widget(close_btn)
+            self._track_popup(popup, '_confirm_popup')
+            self._confirm_popup = popup
+        
+        return self._confirm_popup
+    
+    def _release_confirm_handlers(self, *args):
+        """
+        Unbind the confirmation callbacks from their dialog's buttons so the dialog holds no references to them.
+        """
+        if self._confirm_handlers is None:
+            return
+        
+        popup, on_cancel, on_confirm = self._confirm_handlers
+        self._confirm_handlers = None
+        ids = popup.content.ids
+        ids.cancel_button.funbind('on_press', self._dismiss_and_call, popup, on_cancel)
+        ids.confirm_button.funbind('on_press', self._dismiss_and_call, popup, on_confirm)
+    
+    @staticmethod
+    def _dismiss_and_call(popup, callback, instance):
+        """
+        Dismiss a dialog popup and invoke the optional callback for the pressed button.
+        
+        Parameters:
+            popup: The popup to dismiss.
+            callback (callable or None): Function to call after dismissing.
+            instance: The button that was pressed.
+        """
+        popup.dismiss()
+        if callback:
+            callback()
+    
+    def show_error(self, title: str, message: str):
+        """
+        Displays a standardized error popup dialog with a given title and message.
+        
+        The popup includes an OK button to dismiss it. Logs the error message as a warning. If popup creation fails, logs the exception.
+        """
+        try:
+            popup = self._get_error_popup()
+            popup.title = title
+            popup.content.ids.message_label.text = message
             
             popup.open()
-            Logger.warning(f"{self.__class__.__name__}: {title} - {message}")
+            Logger.warning("%s: %s - %s", self._log_prefix, title, message)
             
         except Exception as e:
-            Logger.error(f"BaseScreen: Failed to show error popup: {e}")
+            Logger.error("BaseScreen: Failed to show error popup: %s", e)
     
-    def show_confirmation(self, title: str, message: str, on_confirm=None, on_cancel=None):
+    def show_confirmation(self, title: str, message: str, on_confirm=None, on_cancel=None, callback=None):
         """
         Display a confirmation dialog with customizable title and message, and optional callbacks for confirm and cancel actions.
         
@@ -135,55 +313,29 @@ class BaseScreen(Screen):
             message (str): The message displayed in the dialog.
             on_confirm (callable, optional): Function to call if the user confirms.
             on_cancel (callable, optional): Function to call if the user cancels.
+            callback (callable, optional): Legacy alias for `on_confirm`, used when `on_confirm` is not given.
         """
+        if on_confirm is None:
+            on_confirm = callback
+        
         try:
-            content = BoxLayout(orientation='vertical', spacing='15dp', padding='20dp')
-            
-            content.add_widget(Label(
-                text=message,
-                text_size=(None, None),
-                halign='center'
-            ))
-            
-            buttons = BoxLayout(orientation='horizontal', spacing='10dp', size_hint_y=None, height='50dp')
-            
-            cancel_btn = Button(text='Cancel', size_hint_x=0.5)
-            confirm_btn = Button(text='Confirm', size_hint_x=0.5, background_color=[0.2, 0.6, 0.2, 1])
+            # A dialog still open from an earlier call is reused; drop its handlers first
+            self._release_confirm_handlers()
             
-            buttons.add_widget(cancel_btn)
-            buttons.add_widget(confirm_btn)
-            content.add_widget(buttons)
-            
-            popup = Popup(
-                title=title,
-                content=content,
-                size_hint=(0.8, 0.5),
-                auto_dismiss=False
-            )
+            popup = self._get_confirm_popup()
+            popup.title = title
+            ids = popup.content.ids
+            ids.message_label.text = message
             
-            def _on_cancel(instance):
-                """
-                Handles the cancel action in a confirmation dialog by dismissing the popup and invoking the optional cancel callback.
-                """
-                popup.dismiss()
-                if on_cancel:
-                    on_cancel()
-            
-            def _on_confirm(instance):
-                """
-                Handles the confirm action in a confirmation dialog by dismissing the popup and invoking the confirmation callback if provided.
-                """
-                popup.dismiss()
-                if on_confirm:
-                    on_confirm()
-            
-            cancel_btn.bind(on_press=_on_cancel)
-            confirm_btn.bind(on_press=_on_confirm)
+            # fbind passes the popup and callback through, so no closures are created per dialog
+            ids.cancel_button.fbind('on_press', self._dismiss_and_call, popup, on_cancel)
+            ids.confirm_button.fbind('on_press', self._dismiss_and_call, popup, on_confirm)
+            self._confirm_handlers = (popup, on_cancel, on_confirm)
             
             popup.open()
             
         except Exception as e:
-            Logger.error(f"BaseScreen: Failed to show confirmation dialog: {e}")
+            Logger.error("BaseScreen: Failed to show confirmation dialog: %s", e)
     
     def validate_numeric_input(self, value, min_val=None, max_val=None, input_type=int):
         """
@@ -200,21 +352,26 @@ class BaseScreen(Screen):
         Returns:
             The converted numeric value if valid; otherwise, None.
         """
+        too_small_msg, too_large_msg, invalid_msg = _range_msgs(min_val, max_val, input_type.__name__)
+        
         try:
-            converted_value = input_type(value)
+            # Keypad digits skip int()'s general parsing on the common path
+            converted_value = _int_fast(value) if input_type is int else None
+            if converted_value is None:
+                converted_value = input_type(value)
             
             if min_val is not None and converted_value < min_val:
-                self.show_error("Invalid Value", f"Value must be at least {min_val}")
+                self.show_error("Invalid Value", too_small_msg)
                 return None
                 
             if max_val is not None and converted_value > max_val:
-                self.show_error("Invalid Value", f"Value must be at most {max_val}")
+                self.show_error("Invalid Value", too_large_msg)
                 return None
                 
             return converted_value
             
         except (ValueError, TypeError):
-            self.show_error("Invalid Input", f"Please enter a valid {input_type.__name__}")
+            self.show_error("Invalid Input", invalid_msg)
             return None
 
 
@@ -226,24 +383,47 @@ class BaseSettingsScreen(BaseScreen):
     
     def __init__(self, **kwargs):
         """
-        Initializes the settings screen and binds to external settings changes to enable automatic updates when settings are modified elsewhere.
+        Initializes the settings screen; it listens for external settings changes only while it is the current screen.
         """
         super().__init__(**kwargs)
-        # Bind to settings changes
-        settings_manager.bind(settings=self.on_settings_changed)
+        self._reload_ev = None
     
     def on_enter(self):
         """
-        Triggered when the screen is entered; initiates loading of settings for the screen.
+        Triggered when the screen is entered; subscribes to settings changes and loads the settings for the screen.
         """
+        settings_manager.bind(settings=self.on_settings_changed)
         self.load_settings()
     
+    def on_leave(self):
+        """
+        Triggered when the screen is left; stops listening for settings changes and drops any pending reload.
+        """
+        settings_manager.unbind(settings=self.on_settings_changed)
+        if self._reload_ev is not None:
+            self._reload_ev.cancel()
+            self._reload_ev = None
+    
     def on_settings_changed(self, instance, settings):
         """
-        Handles external updates to settings by reloading the current settings.
+        Handles external updates to settings by scheduling a reload of the current settings.
+        
+        This method is triggered when the settings manager signals that settings have changed elsewhere, ensuring the screen reflects the latest values. Notifications arriving within 50 ms of each other result in one reload.
+        """
+        # Hidden screens reload on their next on_enter anyway
+        if not (self.manager and self.manager.current == self.name):
+            return
         
-        This method is triggered when the settings manager signals that settings have changed elsewhere, ensuring the screen reflects the latest values.
+        # Coalesce a burst of writes (e.g. a category reset) into a single reload
+        if self._reload_ev is not None:
+            self._reload_ev.cancel()
+        self._reload_ev = Clock.schedule_once(self._reload_settings, 0.05)
+    
+    def _reload_settings(self, dt):
+        """
+        Reload the screen's settings once a burst of change notifications has settled.
         """
+        self._reload_ev = None
         self.load_settings()
     
     def load_settings(self):
@@ -252,7 +432,7 @@ class BaseSettingsScreen(BaseScreen):
         
         Intended to be overridden in subclasses to implement loading of specific settings when the screen is entered.
         """
-        Logger.info(f"{self.__class__.__name__}: Loading settings")
+        Logger.info("%s: Loading settings", self._log_prefix)
     
     def navigate_back(self):
         """
@@ -270,7 +450,7 @@ class BaseSettingsScreen(BaseScreen):
         
         This method presents a warning dialog to the user. If confirmed, it executes the provided reset callback or defaults to the class's reset logic.
         """
-        message = f"Reset all {settings_category} settings to factory defaults?\n\nThis action cannot be undone."
+        title, message = _reset_texts(settings_category)
         
         def perform_reset():
             """
@@ -282,7 +462,7 @@ class BaseSettingsScreen(BaseScreen):
                 self.reset_to_defaults()
         
         self.show_confirmation(
-            f"Reset {settings_category.title()} Settings",
+            title,
             message,
             on_confirm=perform_reset
         )
@@ -291,4 +471,4 @@ class BaseSettingsScreen(BaseScreen):
         """
         Stub method for resetting settings to factory defaults; should be overridden in subclasses to implement specific reset logic.
         """
-        Logger.warning(f"{self.__class__.__name__}: reset_to_defaults not implemented")
+        Logger.warning("%s: reset_to_defaults not implemented", self._log_prefix)
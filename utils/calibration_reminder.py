@@ -20,7 +20,16 @@ class CalibrationReminder:
     """
     
     def __init__(self):
+        # The reminder popup while it is shown; None otherwise
         self.popup = None
+        # Reminder popup and its message label, built on first use and kept for reuse
+        self._popup = None
+        self._message_label = None
+        # (interval_days, o2_last_cal, he_last_cal) for the periodic check; None when stale
+        self._cache = None
+        self._cache_uid = None
+        # Hourly check; None while reminders are disabled or not yet scheduled
+        self._clock_event = None
         
     def check_calibration_due(self) -> Dict[str, Any]:
         """
@@ -29,6 +38,42 @@ class CalibrationReminder:
         Returns:
             Dict with calibration status information
         """
+        return self._calibration_status(*self._read_calibration_inputs())
+    
+    def _read_calibration_inputs(self):
+        """
+        Read the calibration interval and the last O2 and He calibration dates from the database.
+        
+        Returns:
+            tuple: (interval_days, o2_last_cal, he_last_cal)
+        """
+        interval_days = db_manager.get_setting('sensors', 'calibration_interval_days', 30)
+        return interval_days, db_manager.get_last_calibration('o2'), db_manager.get_last_calibration('he')
+    
+    def _cached_calibration_inputs(self):
+        """
+        Return the calibration inputs, reading the database only after a relevant change.
+        """
+        if self._cache is None:
+            self._cache = self._read_calibration_inputs()
+        return self._cache
+    
+    def _on_data_changed(self, instance, data_type, key, value):
+        """
+        Drop the cached calibration inputs when a calibration or sensors setting changes, and resume the periodic check when reminders are switched back on.
+        """
+        if data_type in ('calibration', 'factory_reset') or (
+                data_type == 'setting' and key.startswith('sensors.')):
+            self._cache = None
+        
+        if data_type == 'factory_reset' or (
+                data_type == 'setting' and key == 'sensors.auto_calibration_reminder' and value):
+            self.re_enable()
+    
+    def _calibration_status(self, interval_days, o2_last_cal, he_last_cal) -> Dict[str, Any]:
+        """
+        Build the calibration status for the given interval and last calibration dates.
+        """
         result = {
             'o2_due': False,
             'he_due': False,
@@ -36,15 +81,10 @@ class CalibrationReminder:
             'he_days_overdue': 0,
             'o2_last_calibration': None,
             'he_last_calibration': None,
-            'interval_days': db_manager.get_setting('sensors', 'calibration_interval_days', 30)
+            'interval_days': interval_days
         }
         
-        # Get calibration dates from database
-        o2_last_cal = db_manager.get_last_calibration('o2')
-        he_last_cal = db_manager.get_last_calibration('he')
-        
         current_date = datetime.now()
-        interval_days = result['interval_days']
         
         # Check O2 calibration
         if o2_last_cal:
@@ -80,6 +120,10 @@ class CalibrationReminder:
         if calibration_status is None:
             calibration_status = self.check_calibration_due()
         
+        self._show_if_due(calibration_status)
+    
+    def _show_if_due(self, calibration_status: Dict[str, Any]):
+        """Show the reminder popup for a status in which something is due, unless one is already open"""
         # Only show if something is due
         if not (calibration_status['o2_due'] or calibration_status['he_due']):
             return
@@ -91,7 +135,17 @@ class CalibrationReminder:
         self._create_reminder_popup(calibration_status)
     
     def _create_reminder_popup(self, status: Dict[str, Any]):
-        """Create and show the calibration reminder popup"""
+        """Show the calibration reminder popup, building its widgets on first use"""
+        if self._popup is None:
+            self._build_popup_once()
+        
+        self._update_popup_text(status)
+        
+        self.popup = self._popup
+        self.popup.open()
+    
+    def _build_popup_once(self):
+        """Build the reminder popup and bind its buttons; it is reused for every later reminder"""
         content = BoxLayout(orientation='vertical', spacing='15dp', padding='20dp')
         
         # Title
@@ -104,40 +158,14 @@ class CalibrationReminder:
         )
         content.add_widget(title_label)
         
-        # Message content
-        message_parts = []
-        
-        if status['o2_due']:
-            if status['o2_last_calibration']:
-                days_overdue = status['o2_days_overdue']
-                if days_overdue > 0:
-                    message_parts.append(f"O2 sensor calibration is {days_overdue} days overdue")
-                else:
-                    message_parts.append("O2 sensor calibration is due")
-            else:
-                message_parts.append("O2 sensor has never been calibrated")
-        
-        if status['he_due']:
-            if status['he_last_calibration']:
-                days_overdue = status['he_days_overdue']
-                if days_overdue > 0:
-                    message_parts.append(f"He sensor calibration is {days_overdue} days overdue")
-                else:
-                    message_parts.append("He sensor calibration is due")
-            else:
-                message_parts.append("He sensor has never been calibrated")
-        
-        message_text = "\n\n".join(message_parts)
-        message_text += f"\n\nRecommended calibration interval: {status['interval_days']} days"
-        
-        message_label = Label(
-            text=message_text,
+        # Message content, filled in by _update_popup_text
+        self._message_label = Label(
             font_size='16sp',
             text_size=(400, None),
             halign='center',
             valign='middle'
         )
-        content.add_widget(message_label)
+        content.add_widget(self._message_label)
         
         # Buttons
         buttons = BoxLayout(
@@ -171,7 +199,7 @@ class CalibrationReminder:
         content.add_widget(buttons)
         
         # Create popup
-        self.popup = Popup(
+        self._popup = Popup(
             title='Calibration Required',
             content=content,
             size_hint=(0.9, 0.7),
@@ -182,8 +210,35 @@ class CalibrationReminder:
         remind_later_btn.bind(on_press=self._remind_later)
         disable_btn.bind(on_press=self._disable_reminders)
         calibrate_btn.bind(on_press=self._go_to_calibration)
+    
+    def _update_popup_text(self, status: Dict[str, Any]):
+        """Set the reminder message for the given calibration status"""
+        message_parts = []
         
-        self.popup.open()
+        if status['o2_due']:
+            if status['o2_last_calibration']:
+                days_overdue = status['o2_days_overdue']
+                if days_overdue > 0:
+                    message_parts.append(f"O2 sensor calibration is {days_overdue} days overdue")
+                else:
+                    message_parts.append("O2 sensor calibration is due")
+            else:
+                message_parts.append("O2 sensor has never been calibrated")
+        
+        if status['he_due']:
+            if status['he_last_calibration']:
+                days_overdue = status['he_days_overdue']
+                if days_overdue > 0:
+                    message_parts.append(f"He sensor calibration is {days_overdue} days overdue")
+                else:
+                    message_parts.append("He sensor calibration is due")
+            else:
+                message_parts.append("He sensor has never been calibrated")
+        
+        message_text = "\n\n".join(message_parts)
+        message_text += f"\n\nRecommended calibration interval: {status['interval_days']} days"
+        
+        self._message_label.text = message_text
     
     def _remind_later(self, button):
         """Close popup and remind later"""
@@ -194,6 +249,12 @@ class CalibrationReminder:
     def _disable_reminders(self, button):
         """Disable calibration reminders"""
         db_manager.set_setting('sensors', 'auto_calibration_reminder', False)
+        
+        # Nothing left for the hourly check to do until re_enable()
+        if self._clock_event is not None:
+            self._clock_event.cancel()
+            self._clock_event = None
+        
         if self.popup:
             self.popup.dismiss()
             self.popup = None
@@ -244,22 +305,39 @@ class CalibrationReminder:
     
     def schedule_periodic_check(self):
         """Schedule periodic calibration checks"""
+        # Keep the inputs of the hourly check cached until the database reports a change
+        if self._cache_uid is None:
+            self._cache_uid = db_manager.fbind('on_data_changed', self._on_data_changed)
+        
         # Check every hour for calibration reminders
-        Clock.schedule_interval(self._periodic_check, 3600)  # 3600 seconds = 1 hour
+        if self._clock_event is None:
+            self._clock_event = Clock.schedule_interval(self._periodic_check, 3600)  # 3600 seconds = 1 hour
+    
+    def re_enable(self):
+        """Resume the periodic check after reminders were switched back on"""
+        self.schedule_periodic_check()
+    
+    def _overdue_status(self):
+        """
+        Evaluate the cached calibration inputs for the periodic check.
+        
+        Returns:
+            tuple: (should_show, status), where should_show is True if a sensor is overdue, not just due
+        """
+        status = self._calibration_status(*self._cached_calibration_inputs())
+        should_show = status['o2_days_overdue'] > 0 or status['he_days_overdue'] > 0
+        return should_show, status
     
     def _periodic_check(self, dt):
         """Periodic check for calibration reminders"""
-        calibration_status = self.check_calibration_due()
-        
-        # Only show reminder if something is overdue (not just due)
-        show_reminder = False
-        if calibration_status['o2_due'] and calibration_status['o2_days_overdue'] > 0:
-            show_reminder = True
-        if calibration_status['he_due'] and calibration_status['he_days_overdue'] > 0:
-            show_reminder = True
+        if not db_manager.get_setting('sensors', 'auto_calibration_reminder', True):
+            # Returning False unschedules the interval; re_enable() starts it again
+            self._clock_event = None
+            return False
         
-        if show_reminder:
-            self.show_calibration_reminder(calibration_status)
+        should_show, calibration_status = self._overdue_status()
+        if should_show:
+            self._show_if_due(calibration_status)
 
 
 # Global calibration reminder instance
@@ -6,14 +6,181 @@ calibration history, and system state.
 
 import sqlite3
 import json
+import copy
 import os
+import queue
+import threading
+import time
+import atexit
+import weakref
+from functools import partial
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Dict, Optional, List, Tuple
+from kivy.clock import Clock
 from kivy.event import EventDispatcher
 from kivy.logger import Logger
 
 from version import __version__
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Marks a settings cache miss, since None is a valid cached value
+_MISSING = object()
+
+def _format_timestamp(value: datetime) -> str:
+    """Store datetimes in the 'YYYY-MM-DD HH:MM:SS.ffffff' form already used by existing rows"""
+    return value.isoformat(' ')
+
+
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """Read a stored timestamp back as a datetime, or None if the stored value is malformed"""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        Logger.warning(f"DatabaseManager: Ignoring malformed timestamp {value!r}")
+        return None
+
+
+# Compact UTF-8 JSON, the same layout orjson writes, so stored values do not depend on whether it is installed
+_json_dumps = partial(json.dumps, separators=(',', ':'), ensure_ascii=False)
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        """Encode JSON with orjson when it is installed; non-str keys become strings as with json.dumps"""
+        encoded = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        # orjson writes NaN and Infinity as null; json.dumps keeps them, so let it encode anything that may hold one
+        if b'null' in encoded:
+            return _json_dumps(obj)
+        return encoded.decode()
+else:
+    _dumps = _json_dumps
+
+
+def _parse_bool(value_str: str) -> bool:
+    """Read back a stored 'True' or 'False'"""
+    return value_str.lower() == 'true'
+
+
+# Setting (de)serialization keyed on the exact value type and on the stored data type name;
+# bool gets its own entry because it is a subclass of int
+_TYPE_SERIALIZERS = {
+    bool: ('bool', str),
+    int: ('int', str),
+    float: ('float', str),
+    str: ('str', str),
+    dict: ('json', _dumps),
+    list: ('json', _dumps),
+}
+_TYPE_DESERIALIZERS = {
+    'bool': _parse_bool,
+    'int': int,
+    'float': float,
+    'json': json.loads,
+}
+
+# System events are written in batches of up to this many rows, at most this many seconds after logging
+_EVENT_BATCH_SIZE = 64
+_EVENT_FLUSH_INTERVAL = 5.0
+# Longest flush_events() waits for the event thread before giving up
+_EVENT_FLUSH_TIMEOUT = 10.0
+
+# Managers with a running event thread, flushed at exit; weak so unclosed managers can still be collected
+_event_writers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_event_writers():
+    """Write the queued system events of every open manager before the interpreter exits"""
+    for manager in list(_event_writers):
+        manager.flush_events()
+
+# Statements on the hot paths, passed as the same string objects every call so
+# sqlite3's per-connection statement cache always finds them
+_SQL_SET_SETTING = '''
+    INSERT OR REPLACE INTO settings (category, key, value, data_type, updated_at)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+'''
+_SQL_GET_SETTING = 'SELECT value, data_type FROM settings WHERE category = ? AND key = ?'
+_SQL_GET_CATEGORY = 'SELECT key, value, data_type FROM settings WHERE category = ? ORDER BY key'
+_SQL_RECORD_CAL = '''
+    INSERT INTO calibration_history
+    (sensor_type, calibration_date, voltage_reading, temperature, notes)
+    VALUES (?, ?, ?, ?, ?)
+'''
+_SQL_LAST_CAL = '''
+    SELECT calibration_date FROM calibration_history
+    WHERE sensor_type = ?
+    ORDER BY calibration_date DESC
+'''
+_SQL_LOG_EVENT = 'INSERT INTO system_events (event_type, event_data) VALUES (?, ?)'
+
+# Columns returned by get_calibration_history, in select order; all of them are in
+# idx_calibration_cover, so the sensor-filtered query never reads the table rows
+_CAL_HISTORY_COLUMNS = ('id', 'sensor_type', 'calibration_date', 'voltage_reading',
+                        'temperature', 'notes', 'created_at')
+_SQL_CAL_HISTORY_BY_SENSOR = '''
+    SELECT id, sensor_type, calibration_date, voltage_reading, temperature, notes, created_at
+    FROM calibration_history
+    WHERE sensor_type = ?
+    ORDER BY calibration_date DESC
+    LIMIT ?
+'''
+_SQL_CAL_HISTORY = '''
+    SELECT id, sensor_type, calibration_date, voltage_reading, temperature, notes, created_at
+    FROM calibration_history
+    ORDER BY calibration_date DESC
+    LIMIT ?
+'''
+
+# Settings written on first run and after a factory reset; read-only, see get_default_settings
+_DEFAULT_SETTINGS = MappingProxyType({
+    'app': {
+        'first_run': True,
+        'app_version': __version__,
+        'theme': 'dark',
+        'language': 'en',
+        'debug_mode': False,
+        'last_screen': 'home'
+    },
+    'display': {
+        'brightness': 50,
+        'sleep_timeout': 5,
+        'auto_brightness': False
+    },
+    'wifi': {
+        'auto_connect': True,
+        'remember_networks': True,
+        'scan_interval': 30,
+        'last_network': None
+    },
+    'sensors': {
+        'calibration_interval_days': 30,
+        'auto_calibration_reminder': True,
+        'o2_calibration_offset': 0.0,
+        'he_calibration_offset': 0.0,
+        'auto_calibrate': True
+    },
+    'safety': {
+        'max_o2_percentage': 100,
+        'max_he_percentage': 100,
+        'warning_thresholds': {
+            'high_o2': 23.0,
+            'low_o2': 19.0,
+            'high_he': 50.0
+        }
+    },
+    'units': {
+        'pressure': 'bar',
+        'temperature': 'celsius',
+        'depth': 'meters'
+    }
+})
+
 
 class DatabaseManager(EventDispatcher):
     """
@@ -30,18 +197,45 @@ class DatabaseManager(EventDispatcher):
         
         self.db_path = db_path
         self.connection = None
+        # The connection is shared across threads, so reads and writes are serialized
+        self._lock = threading.RLock()
+        # Decoded setting values by (category, key), kept in step with every write;
+        # JSON values are left out so callers cannot mutate a cached dict or list
+        self._settings_cache = {}
+        # PRAGMA data_version when the cache was last known to match the file; it only moves
+        # when another connection commits, so a change means the cache may be stale
+        self._data_version = None
+        # Logged system events waiting to be written by the event thread, which starts on first use
+        self._event_queue = queue.Queue()
+        self._event_thread = None
+        # When True, on_data_changed events wait for the next frame and repeated changes to a key
+        # are dispatched once; the app turns this on once the Kivy loop runs. Off, events are
+        # dispatched synchronously, which is what scripts and migrations without a loop need.
+        self.coalesce_changes = False
+        # Coalesced events waiting for the next frame, by (data_type, key); the last value wins
+        self._pending_changes = {}
+        self._changes_trigger = Clock.create_trigger(self.flush_changes)
+        
+        # Register events before initializing, since first-run defaults dispatch changes
+        self.register_event_type('on_data_changed')
         
         # Initialize database
         self.init_database()
-        
-        # Register events
-        self.register_event_type('on_data_changed')
     
     def init_database(self):
         """Initialize the database with required tables"""
         try:
             self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.connection.row_factory = sqlite3.Row  # Enable column access by name
+            # Rows are plain tuples; readers unpack them positionally
+            
+            # WAL turns each commit into an append to <db>-wal instead of a full fsync of the
+            # database file, which dominates write latency on SD cards. It keeps -wal and -shm
+            # sidecar files next to the database, so copy it with backup_database, not the file.
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+            self.connection.execute('PRAGMA temp_store=MEMORY')
+            self.connection.execute('PRAGMA cache_size=-8000')  # 8 MB
+            self.connection.execute('PRAGMA mmap_size=67108864')  # 64 MB
             
             cursor = self.connection.cursor()
             
@@ -96,7 +290,13 @@ class DatabaseManager(EventDispatcher):
             
             # Create indexes for performance
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_settings_category_key ON settings(category, key)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_calibration_sensor_date ON calibration_history(sensor_type, calibration_date)')
+            # Covering index for calibration lookups; it supersedes idx_calibration_sensor_date
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_calibration_cover ON calibration_history(
+                    sensor_type, calibration_date DESC, voltage_reading, temperature, notes, id, created_at
+                )
+            ''')
+            cursor.execute('DROP INDEX IF EXISTS idx_calibration_sensor_date')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_system_events_type ON system_events(event_type)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_gas_analysis_date ON gas_analysis(analysis_date)')
             
@@ -125,213 +325,234 @@ class DatabaseManager(EventDispatcher):
         
         if count == 0:
             # First run - initialize with defaults
-            default_settings = {
-                'app': {
-                    'first_run': True,
-                    'app_version': __version__,
-                    'theme': 'dark',
-                    'language': 'en',
-                    'debug_mode': False,
-                    'last_screen': 'home'
-                },
-                'display': {
-                    'brightness': 50,
-                    'sleep_timeout': 5,
-                    'auto_brightness': False
-                },
-                'wifi': {
-                    'auto_connect': True,
-                    'remember_networks': True,
-                    'scan_interval': 30,
-                    'last_network': None
-                },
-                'sensors': {
-                    'calibration_interval_days': 30,
-                    'auto_calibration_reminder': True,
-                    'o2_calibration_offset': 0.0,
-                    'he_calibration_offset': 0.0,
-                    'auto_calibrate': True
-                },
-                'safety': {
-                    'max_o2_percentage': 100,
-                    'max_he_percentage': 100,
-                    'warning_thresholds': {
-                        'high_o2': 23.0,
-                        'low_o2': 19.0,
-                        'high_he': 50.0
-                    }
-                },
-                'units': {
-                    'pressure': 'bar',
-                    'temperature': 'celsius',
-                    'depth': 'meters'
-                }
-            }
-            
-            # Insert default settings
-            for category, settings in default_settings.items():
-                for key, value in settings.items():
-                    self.set_setting(category, key, value)
+            # Insert default settings in one transaction; factory_reset notifies listeners once afterwards
+            self.set_settings_bulk(_DEFAULT_SETTINGS, notify=False)
             
             # Log first run
             self.log_system_event('first_run', {'timestamp': datetime.now().isoformat()})
     
+    @staticmethod
+    def _serialize_value(value: Any) -> Tuple[str, str]:
+        """Return the stored string form and data type name for a setting value"""
+        serializer = _TYPE_SERIALIZERS.get(type(value))
+        if serializer is not None:
+            data_type, to_str = serializer
+            return to_str(value), data_type
+        
+        # Subclasses of the built-in types, e.g. an IntEnum or OrderedDict
+        if isinstance(value, bool):
+            return str(value), 'bool'
+        elif isinstance(value, int):
+            return str(value), 'int'
+        elif isinstance(value, float):
+            return str(value), 'float'
+        elif isinstance(value, (dict, list)):
+            return _dumps(value), 'json'
+        else:
+            return str(value), 'str'
+    
+    @staticmethod
+    def _deserialize_value(value_str: str, data_type: str) -> Any:
+        """Return the Python value for a stored string form and data type name"""
+        from_str = _TYPE_DESERIALIZERS.get(data_type)
+        return value_str if from_str is None else from_str(value_str)
+    
+    def _cache_setting(self, category: str, key: str, data_type: str, value: Any):
+        """Write a stored setting's decoded value through to the settings cache"""
+        if data_type == 'json':
+            self._settings_cache.pop((category, key), None)
+        else:
+            self._settings_cache[(category, key)] = value
+    
+    def _queue_change(self, data_type: str, key: Optional[str], value: Any):
+        """Dispatch an on_data_changed event, or queue it for the next frame when coalescing changes"""
+        if not self.coalesce_changes:
+            self.dispatch('on_data_changed', data_type, key, value)
+            return
+        
+        with self._lock:
+            if data_type == 'factory_reset':
+                # A reset supersedes any change still waiting to be announced
+                self._pending_changes.clear()
+            # Re-insert so the event keeps the order of the latest change
+            self._pending_changes.pop((data_type, key), None)
+            self._pending_changes[(data_type, key)] = value
+        self._changes_trigger()
+    
+    def flush_changes(self, *args):
+        """Dispatch the queued on_data_changed events now instead of on the next frame"""
+        with self._lock:
+            pending = self._pending_changes
+            self._pending_changes = {}
+        
+        for (data_type, key), value in pending.items():
+            self.dispatch('on_data_changed', data_type, key, value)
+    
+    def _drop_stale_cache(self):
+        """Clear the settings cache if another connection has committed to the database since it was filled"""
+        data_version = self.connection.execute('PRAGMA data_version').fetchone()[0]
+        if data_version != self._data_version:
+            self._settings_cache.clear()
+            self._data_version = data_version
+    
     def set_setting(self, category: str, key: str, value: Any) -> bool:
-        """Set a setting value"""
-        try:
-            cursor = self.connection.cursor()
-            
-            # Determine data type and serialize value
-            if isinstance(value, bool):
-                data_type = 'bool'
-                value_str = str(value)
-            elif isinstance(value, int):
-                data_type = 'int'
-                value_str = str(value)
-            elif isinstance(value, float):
-                data_type = 'float'
-                value_str = str(value)
-            elif isinstance(value, (dict, list)):
-                data_type = 'json'
-                value_str = json.dumps(value)
-            else:
-                data_type = 'str'
-                value_str = str(value)
+        """Set a setting value. Writing the value a setting already has is a no-op that reports success."""
+        with self._lock:
+            try:
+                value_str, data_type = self._serialize_value(value)
+                # The value as it reads back, e.g. None is stored as the string 'None'
+                stored_value = self._deserialize_value(value_str, data_type)
+                
+                # Skip the commit and change event when the cached value is the same, trusting
+                # the cache only if no other connection wrote since; the type check keeps True
+                # from matching a cached 1
+                self._drop_stale_cache()
+                cached = self._settings_cache.get((category, key), _MISSING)
+                if type(cached) is type(stored_value) and cached == stored_value:
+                    return True
+                
+                # Upsert setting; the connection commits on exit and rolls back on error
+                with self.connection as conn:
+                    conn.execute(_SQL_SET_SETTING, (category, key, value_str, data_type))
+                
+                self._cache_setting(category, key, data_type, stored_value)
+                
+                # Announce the change, coalesced with other writes if enabled
+                self._queue_change('setting', f"{category}.{key}", value)
+                
+                return True
+                
+            except Exception as e:
+                Logger.error(f"DatabaseManager: Error setting {category}.{key}: {e}")
+                return False
+    
+    def set_settings_bulk(self, settings: Dict[str, Dict[str, Any]], notify: bool = True) -> bool:
+        """Set many settings, given as {category: {key: value}}, in a single transaction.
+        
+        With notify=False no per-setting on_data_changed events are queued.
+        """
+        rows = [
+            (category, key) + self._serialize_value(value)
+            for category, values in settings.items()
+            for key, value in values.items()
+        ]
+        
+        with self._lock:
+            try:
+                with self.connection as conn:
+                    conn.executemany(_SQL_SET_SETTING, rows)
+                
+            except Exception as e:
+                Logger.error(f"DatabaseManager: Error setting {len(rows)} settings: {e}")
+                return False
             
-            # Upsert setting
-            cursor.execute('''
-                INSERT OR REPLACE INTO settings (category, key, value, data_type, updated_at)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (category, key, value_str, data_type))
+            for category, key, value_str, data_type in rows:
+                self._cache_setting(category, key, data_type, self._deserialize_value(value_str, data_type))
             
-            self.connection.commit()
+            if not notify:
+                return True
             
-            # Dispatch change event
-            self.dispatch('on_data_changed', 'setting', f"{category}.{key}", value)
+            # Queue change events once everything is committed
+            for category, values in settings.items():
+                for key, value in values.items():
+                    self._queue_change('setting', f"{category}.{key}", value)
             
             return True
-            
-        except Exception as e:
-            Logger.error(f"DatabaseManager: Error setting {category}.{key}: {e}")
-            return False
     
     def get_setting(self, category: str, key: str, default: Any = None) -> Any:
         """Get a setting value"""
-        try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute('''
-                SELECT value, data_type FROM settings 
-                WHERE category = ? AND key = ?
-            ''', (category, key))
-            
-            result = cursor.fetchone()
-            
-            if result is None:
-                return default
-            
-            value_str, data_type = result
+        with self._lock:
+            cached = self._settings_cache.get((category, key), _MISSING)
+            if cached is not _MISSING:
+                return cached
             
-            # Deserialize based on data type
-            if data_type == 'bool':
-                return value_str.lower() == 'true'
-            elif data_type == 'int':
-                return int(value_str)
-            elif data_type == 'float':
-                return float(value_str)
-            elif data_type == 'json':
-                return json.loads(value_str)
-            else:
-                return value_str
+            try:
+                cursor = self.connection.cursor()
                 
-        except Exception as e:
-            Logger.error(f"DatabaseManager: Error getting {category}.{key}: {e}")
-            return default
+                cursor.execute(_SQL_GET_SETTING, (category, key))
+                
+                result = cursor.fetchone()
+                
+                if result is None:
+                    return default
+                
+                value_str, data_type = result
+                value = self._deserialize_value(value_str, data_type)
+                self._cache_setting(category, key, data_type, value)
+                return value
+                    
+            except Exception as e:
+                Logger.error(f"DatabaseManager: Error getting {category}.{key}: {e}")
+                return default
     
     def get_settings_category(self, category: str) -> Dict[str, Any]:
         """Get all settings in a category"""
-        try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute('''
-                SELECT key, value, data_type FROM settings 
-                WHERE category = ?
-                ORDER BY key
-            ''', (category,))
-            
-            settings = {}
-            for row in cursor.fetchall():
-                key, value_str, data_type = row
+        with self._lock:
+            try:
+                cursor = self.connection.cursor()
                 
-                # Deserialize based on data type
-                if data_type == 'bool':
-                    value = value_str.lower() == 'true'
-                elif data_type == 'int':
-                    value = int(value_str)
-                elif data_type == 'float':
-                    value = float(value_str)
-                elif data_type == 'json':
-                    value = json.loads(value_str)
-                else:
-                    value = value_str
+                cursor.execute(_SQL_GET_CATEGORY, (category,))
                 
-                settings[key] = value
-            
-            return settings
-            
-        except Exception as e:
-            Logger.error(f"DatabaseManager: Error getting category {category}: {e}")
-            return {}
+                settings = {}
+                for row in cursor.fetchall():
+                    key, value_str, data_type = row
+                    
+                    value = self._deserialize_value(value_str, data_type)
+                    self._cache_setting(category, key, data_type, value)
+                    settings[key] = value
+                
+                return settings
+                
+            except Exception as e:
+                Logger.error(f"DatabaseManager: Error getting category {category}: {e}")
+                return {}
     
     def record_calibration(self, sensor_type: str, voltage_reading: float = None, 
                           temperature: float = None, notes: str = None) -> bool:
         """Record a sensor calibration"""
-        try:
-            cursor = self.connection.cursor()
-            
-            # Insert calibration record
-            cursor.execute('''
-                INSERT INTO calibration_history 
-                (sensor_type, calibration_date, voltage_reading, temperature, notes)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (sensor_type, datetime.now(), voltage_reading, temperature, notes))
-            
-            self.connection.commit()
-            
-            # Log system event
-            self.log_system_event('calibration', {
-                'sensor_type': sensor_type,
-                'voltage_reading': voltage_reading,
-                'temperature': temperature
-            })
-            
-            # Dispatch change event
-            self.dispatch('on_data_changed', 'calibration', sensor_type, datetime.now())
-            
-            return True
-            
-        except Exception as e:
-            Logger.error(f"DatabaseManager: Error recording calibration: {e}")
-            return False
+        with self._lock:
+            try:
+                # One timestamp for the stored record and the change event
+                calibrated_at = datetime.now()
+                
+                # Insert calibration record
+                with self.connection as conn:
+                    conn.execute(_SQL_RECORD_CAL, (
+                        sensor_type, _format_timestamp(calibrated_at), voltage_reading, temperature, notes
+                    ))
+                
+                # Log system event
+                self.log_system_event('calibration', {
+                    'sensor_type': sensor_type,
+                    'voltage_reading': voltage_reading,
+                    'temperature': temperature
+                })
+                
+                # Announce the change
+                self._queue_change('calibration', sensor_type, calibrated_at)
+                
+                return True
+                
+            except Exception as e:
+                Logger.error(f"DatabaseManager: Error recording calibration: {e}")
+                return False
     
     def get_last_calibration(self, sensor_type: str) -> Optional[datetime]:
         """Get the date of the last calibration for a sensor"""
         try:
-            cursor = self.connection.cursor()
-            
-            cursor.execute('''
-                SELECT calibration_date FROM calibration_history 
-                WHERE sensor_type = ? 
-                ORDER BY calibration_date DESC 
-                LIMIT 1
-            ''', (sensor_type,))
-            
-            result = cursor.fetchone()
-            
-            if result:
-                return datetime.fromisoformat(result[0])
-            
-            return None
+            # The event thread shares the connection, so read under the lock and
+            # close the cursor before releasing it
+            with self._lock:
+                cursor = self.connection.execute(_SQL_LAST_CAL, (sensor_type,))
+                try:
+                    # Malformed dates sort ahead of valid ones, so skip past them
+                    for (calibration_date,) in cursor:
+                        parsed = _parse_timestamp(calibration_date)
+                        if parsed is not None:
+                            return parsed
+                    return None
+                finally:
+                    cursor.close()
             
         except Exception as e:
             Logger.error(f"DatabaseManager: Error getting last calibration: {e}")
@@ -340,92 +561,147 @@ class DatabaseManager(EventDispatcher):
     def get_calibration_history(self, sensor_type: str = None, limit: int = 100) -> List[Dict]:
         """Get calibration history"""
         try:
-            cursor = self.connection.cursor()
-            
-            if sensor_type:
-                cursor.execute('''
-                    SELECT * FROM calibration_history 
-                    WHERE sensor_type = ? 
-                    ORDER BY calibration_date DESC 
-                    LIMIT ?
-                ''', (sensor_type, limit))
-            else:
-                cursor.execute('''
-                    SELECT * FROM calibration_history 
-                    ORDER BY calibration_date DESC 
-                    LIMIT ?
-                ''', (limit,))
-            
-            history = []
-            for row in cursor.fetchall():
-                history.append({
-                    'id': row['id'],
-                    'sensor_type': row['sensor_type'],
-                    'calibration_date': row['calibration_date'],
-                    'voltage_reading': row['voltage_reading'],
-                    'temperature': row['temperature'],
-                    'notes': row['notes'],
-                    'created_at': row['created_at']
-                })
+            # Fetch every row under the lock, since the event thread shares the connection
+            with self._lock:
+                if sensor_type:
+                    rows = self.connection.execute(_SQL_CAL_HISTORY_BY_SENSOR, (sensor_type, limit)).fetchall()
+                else:
+                    rows = self.connection.execute(_SQL_CAL_HISTORY, (limit,)).fetchall()
             
-            return history
+            return [dict(zip(_CAL_HISTORY_COLUMNS, row)) for row in rows]
             
         except Exception as e:
             Logger.error(f"DatabaseManager: Error getting calibration history: {e}")
             return []
     
     def log_system_event(self, event_type: str, event_data: Dict = None) -> bool:
-        """Log a system event"""
+        """Log a system event.
+        
+        The event is queued and written by a background thread within a few seconds;
+        call flush_events() to have it written before continuing.
+        """
         try:
-            cursor = self.connection.cursor()
-            
-            event_data_json = json.dumps(event_data) if event_data else None
-            
-            cursor.execute('''
-                INSERT INTO system_events (event_type, event_data)
-                VALUES (?, ?)
-            ''', (event_type, event_data_json))
-            
-            self.connection.commit()
-            return True
-            
+            # Events without data, the common case, skip encoding altogether
+            event_data_json = _dumps(event_data) if event_data else None
         except Exception as e:
             Logger.error(f"DatabaseManager: Error logging system event: {e}")
             return False
+        
+        with self._lock:
+            if self.connection is None:
+                Logger.error(f"DatabaseManager: Cannot log system event '{event_type}': database is closed")
+                return False
+            
+            if self._event_thread is None:
+                # The thread only holds a weak reference, so an unclosed manager can still be collected
+                self._event_thread = threading.Thread(
+                    target=self._event_flush_loop, args=(weakref.ref(self), self._event_queue),
+                    name='DatabaseEventWriter', daemon=True
+                )
+                self._event_thread.start()
+                _event_writers.add(self)
+            
+            self._event_queue.put_nowait((event_type, event_data_json))
+        return True
+    
+    def flush_events(self):
+        """Block until every system event logged so far has been written, or the event thread stops responding"""
+        thread = self._event_thread
+        if thread is None or not thread.is_alive():
+            return
+        
+        done = threading.Event()
+        self._event_queue.put(done)
+        if not done.wait(_EVENT_FLUSH_TIMEOUT):
+            Logger.error("DatabaseManager: Timed out waiting for system events to be written")
+    
+    @staticmethod
+    def _event_flush_loop(manager_ref, events):
+        """Write queued system events in batches until close() queues None or the manager is gone"""
+        while True:
+            batch = []
+            waiters = []
+            stop = False
+            
+            # Collect events until the batch is full, the interval is up, or a flush or stop arrives
+            item = events.get()
+            deadline = time.monotonic() + _EVENT_FLUSH_INTERVAL
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= _EVENT_BATCH_SIZE:
+                    break
+                try:
+                    item = events.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            
+            if batch:
+                manager = manager_ref()
+                if manager is None:
+                    return
+                manager._write_events(batch)
+                del manager
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+    
+    def _write_events(self, batch: List[Tuple[str, Optional[str]]]):
+        """Insert a batch of (event_type, event_data_json) rows in one transaction"""
+        with self._lock:
+            try:
+                with self.connection as conn:
+                    conn.executemany(_SQL_LOG_EVENT, batch)
+                
+            except Exception as e:
+                Logger.error(f"DatabaseManager: Error writing {len(batch)} system events: {e}")
     
     def factory_reset(self) -> bool:
         """Perform factory reset - clear all data and reinitialize"""
-        try:
-            cursor = self.connection.cursor()
-            
-            # Log factory reset before clearing data
-            self.log_system_event('factory_reset', {'timestamp': datetime.now().isoformat()})
-            
-            # Clear all tables
-            cursor.execute('DELETE FROM settings')
-            cursor.execute('DELETE FROM calibration_history')
-            cursor.execute('DELETE FROM gas_analysis')
-            # Keep system_events for audit trail
-            
-            self.connection.commit()
-            
-            # Reinitialize default settings
-            self._initialize_default_settings()
-            
-            # Dispatch change event
-            self.dispatch('on_data_changed', 'factory_reset', None, None)
-            
-            return True
-            
-        except Exception as e:
-            Logger.error(f"DatabaseManager: Error during factory reset: {e}")
-            return False
+        with self._lock:
+            try:
+                # Log factory reset before clearing data
+                self.log_system_event('factory_reset', {'timestamp': datetime.now().isoformat()})
+                
+                # Clear all tables in one transaction
+                with self.connection as conn:
+                    conn.execute('DELETE FROM settings')
+                    conn.execute('DELETE FROM calibration_history')
+                    conn.execute('DELETE FROM gas_analysis')
+                    # Keep system_events for audit trail
+                self._settings_cache.clear()
+                
+                # Reinitialize default settings
+                self._initialize_default_settings()
+                
+                # Announce the reset
+                self._queue_change('factory_reset', None, None)
+                
+                return True
+                
+            except Exception as e:
+                Logger.error(f"DatabaseManager: Error during factory reset: {e}")
+                return False
     
     def backup_database(self, backup_path: str) -> bool:
         """Create a backup of the database"""
+        # Include events that are still queued
+        self.flush_events()
+        
         try:
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
+            # Use SQLite's online backup so in-memory databases can be backed up too
+            backup = sqlite3.connect(backup_path)
+            try:
+                with self._lock:
+                    self.connection.backup(backup)
+            finally:
+                backup.close()
             
             self.log_system_event('backup_created', {'backup_path': backup_path})
             
@@ -436,17 +712,36 @@ class DatabaseManager(EventDispatcher):
             return False
     
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Dispatch pending change events, write pending system events and close database connection"""
+        self._changes_trigger.cancel()
+        self.flush_changes()
+        
+        if self._event_thread is not None:
+            self._event_queue.put(None)
+            # __del__ can run on the event thread itself, which must not join itself
+            if self._event_thread is not threading.current_thread():
+                self._event_thread.join(_EVENT_FLUSH_TIMEOUT)
+            self._event_thread = None
+            _event_writers.discard(self)
+        
+        with self._lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
     
     def on_data_changed(self, data_type: str, key: str, value: Any):
-        """Event handler for data changes. Override in subclasses."""
+        """Event handler for data changes. Override in subclasses.
+        
+        Dispatched synchronously by the writing call, unless coalesce_changes is set: then it is
+        dispatched on the next Kivy frame (or by flush_changes()), once per changed key with its
+        latest value, and a factory_reset drops the changes queued before it.
+        """
         pass
     
     def __del__(self):
         """Cleanup on deletion"""
+        # Never run listeners from garbage collection or the event thread
+        self._pending_changes.clear()
         self.close()
 
     def get_default_settings(self) -> Dict[str, Any]:
@@ -454,50 +749,9 @@ class DatabaseManager(EventDispatcher):
         Return the default settings dictionary used to initialize the application's configuration.
         
         Returns:
-            Dict[str, Any]: A nested dictionary containing default values for app, display, wifi, sensors, safety, and units settings.
+            Dict[str, Any]: A nested dictionary containing default values for app, display, wifi, sensors, safety, and units settings. It is a fresh copy the caller may modify.
         """
-        return {
-            'app': {
-                'first_run': True,
-                'app_version': __version__,
-                'theme': 'dark',
-                'language': 'en',
-                'debug_mode': False,
-                'last_screen': 'home'
-            },
-            'display': {
-                'brightness': 50,
-                'sleep_timeout': 5,
-                'auto_brightness': False
-            },
-            'wifi': {
-                'auto_connect': True,
-                'remember_networks': True,
-                'scan_interval': 30,
-                'last_network': None
-            },
-            'sensors': {
-                'calibration_interval_days': 30,
-                'auto_calibration_reminder': True,
-                'o2_calibration_offset': 0.0,
-                'he_calibration_offset': 0.0,
-                'auto_calibrate': True
-            },
-            'safety': {
-                'max_o2_percentage': 100,
-                'max_he_percentage': 100,
-                'warning_thresholds': {
-                    'high_o2': 23.0,
-                    'low_o2': 19.0,
-                    'high_he': 50.0
-                }
-            },
-            'units': {
-                'pressure': 'bar',
-                'temperature': 'celsius',
-                'depth': 'meters'
-            }
-        }
+        return copy.deepcopy(dict(_DEFAULT_SETTINGS))
 
 
 # Global database manager instance
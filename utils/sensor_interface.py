@@ -267,14 +267,23 @@ def get_readings() -> dict:
     }
 
 
-def record_readings():
-    """Record current sensor readings to history."""
+def record_readings(n: int = 1):
+    """
+    Record current sensor readings to history.
+    
+    Parameters:
+        n (int): Number of consecutive samples to record in one call.
+    """
     sensors = get_sensors()
-    t = time.time()
-    _history['o2'].append((t, sensors.read_oxygen_percent()))
-    _history['temp'].append((t, sensors.read_temperature_c()))
-    _history['press'].append((t, sensors.read_pressure_hpa()))
-    _history['hum'].append((t, sensors.read_humidity_pct()))
+    samples = [
+        (time.time(), sensors.read_oxygen_percent(), sensors.read_temperature_c(),
+         sensors.read_pressure_hpa(), sensors.read_humidity_pct())
+        for _ in range(n)
+    ]
+    _history['o2'].extend((t, o2) for t, o2, _, _, _ in samples)
+    _history['temp'].extend((t, temp) for t, _, temp, _, _ in samples)
+    _history['press'].extend((t, press) for t, _, _, press, _ in samples)
+    _history['hum'].extend((t, hum) for t, _, _, _, hum in samples)
 
 
 def get_history(key: str):
@@ -4,12 +4,24 @@ This replaces the complex settings_adapter and provides backward compatibility.
 """
 
 from utils.database_manager import db_manager
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Dict
 
 
 class SimpleSettings:
     """Simplified settings interface that maps to database manager"""
     
+    def __init__(self):
+        """
+        Initialize the settings interface with no bound callbacks.
+        """
+        # Legacy 'settings' callback -> (database manager, uid of its adapter there);
+        # uids are only unique per dispatcher, so the manager is kept alongside
+        self._bind_uids = {}
+        # While deferring, setting events are only recorded; see defer_notify()
+        self._deferring = False
+        self._pending_notify = False
+    
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         Retrieve a setting value or an entire settings category using a dot notation key.
@@ -50,26 +62,95 @@ class SimpleSettings:
         else:
             raise ValueError("Setting key must include category (e.g., 'display.brightness')")
     
+    def set_many(self, values: Dict[str, Any]) -> bool:
+        """
+        Set several settings at once using dot notation keys, in a single database transaction.
+        
+        Bound 'settings' callbacks are called once for the whole batch rather than once per key.
+        
+        Parameters:
+            values (Dict[str, Any]): Mapping of 'category.key' to the value to assign.
+        
+        Returns:
+            bool: True if all settings were updated successfully, False otherwise.
+        
+        Raises:
+            ValueError: If any key does not include a category (i.e., lacks a dot).
+        """
+        by_category = {}
+        for key_path, value in values.items():
+            if '.' not in key_path:
+                raise ValueError("Setting key must include category (e.g., 'display.brightness')")
+            category, key = key_path.split('.', 1)
+            by_category.setdefault(category, {})[key] = value
+        
+        with self.defer_notify():
+            return db_manager.set_settings_bulk(by_category)
+    
+    @contextmanager
+    def defer_notify(self):
+        """
+        Hold back 'settings' callbacks inside the block, then call each bound callback once if any setting changed.
+        """
+        if self._deferring:
+            # Nested use: the outermost block sends the notification
+            yield
+            return
+        
+        self._deferring = True
+        self._pending_notify = False
+        try:
+            yield
+            # Change events are queued for the next frame; deliver them while still deferring
+            db_manager.flush_changes()
+        finally:
+            self._deferring = False
+            if self._pending_notify:
+                self._pending_notify = False
+                for callback in list(self._bind_uids):
+                    callback(db_manager, {})
+    
     def bind(self, **kwargs):
         """
         Registers a callback for settings changes, adapting the callback signature for backward compatibility.
         
-        If a 'settings' callback is provided, it is invoked when a setting changes, using the legacy callback format.
+        If a 'settings' callback is provided, it is invoked when a setting changes, using the legacy callback format. Binding the same callback again has no effect, unless the database manager has since been replaced, in which case the callback moves to the new one.
         """
         # Map to database manager events
         if 'settings' in kwargs:
             callback = kwargs['settings']
+            bound = self._bind_uids.get(callback)
+            if bound is not None:
+                if bound[0] is db_manager:
+                    return
+                self.unbind(settings=callback)
             # Create a wrapper that adapts the database callback to the old format
             def adapted_callback(instance, data_type, key, value):
                 """
                 Adapts a settings change event to the legacy callback signature.
                 
-                Calls the provided callback with an empty settings dictionary when the data type is 'setting'.
+                Calls the provided callback with an empty settings dictionary when a setting changes or all settings are reset.
                 """
-                if data_type == 'setting':
+                if data_type in ('setting', 'factory_reset'):
+                    if self._deferring:
+                        self._pending_notify = True
+                        return
                     # Call the old callback with a fake settings dict
                     callback(instance, {})
-            db_manager.bind(on_data_changed=adapted_callback)
+            # fbind skips bind()'s keyword handling and returns a uid for cheap unbinding
+            self._bind_uids[callback] = (db_manager, db_manager.fbind('on_data_changed', adapted_callback))
+    
+    def unbind(self, **kwargs):
+        """
+        Remove a callback previously registered with `bind`.
+        
+        Unknown callbacks are ignored, so unbinding twice is harmless.
+        """
+        if 'settings' in kwargs:
+            bound = self._bind_uids.pop(kwargs['settings'], None)
+            if bound is not None:
+                dispatcher, uid = bound
+                dispatcher.unbind_uid('on_data_changed', uid)
     
     def factory_reset(self) -> bool:
         """
@@ -80,10 +161,12 @@ class SimpleSettings:
         """
         return db_manager.factory_reset()
     
-    @property 
+    @property
     def default_settings(self):
         """
         Returns the application's default settings from the underlying database manager.
+        
+        Each read returns a fresh copy, so callers may edit it (e.g. to build a reset payload) without affecting the defaults.
         """
         return db_manager.get_default_settings()
 